@@ -0,0 +1,259 @@
+'''
+Headless stress benchmark of the drag-and-drop behaviors.
+
+Drives synthetic touches through :class:`KXDraggableBehavior`, :class:`KXDragTargetBehavior` and
+:class:`KXDragReorderBehavior`, and reports, for each scenario, the time spent per touch move (the touch event
+plus the frame it triggers), the memory allocated per move, and the number of layout passes.
+
+.. code-block:: console
+
+    python benchmarks/drag_and_drop.py                   # run and compare with the baselines
+    python benchmarks/drag_and_drop.py --save-baselines  # run and overwrite the baselines
+    python benchmarks/drag_and_drop.py --check           # exit with 1 if something regressed
+
+The timings depend on the machine, so a regression is only reported when a value exceeds the baseline by the
+``--tolerance`` factor.
+'''
+
+import os
+os.environ.setdefault("KIVY_NO_CONSOLELOG", "1")
+os.environ.setdefault("KIVY_NO_ARGS", "1")
+
+import sys
+import json
+import time
+import statistics
+import tracemalloc
+import argparse
+from pathlib import Path
+from functools import wraps
+from contextlib import contextmanager
+
+from kivy.config import Config
+Config.set("graphics", "maxfps", "0")  # keeps Clock.tick() from sleeping until the next frame
+from kivy.clock import Clock
+from kivy.core.window import Window
+from kivy.tests.common import UnitTestTouch
+from kivy.uix.widget import Widget
+from kivy.uix.label import Label
+from kivy.uix.boxlayout import BoxLayout
+from kivy.uix.gridlayout import GridLayout
+
+import kivyx  # noqa: F401
+from kivyx.uix.behaviors.draggable import KXDraggableBehavior, KXDragTargetBehavior, KXDragReorderBehavior
+
+BASELINES = Path(__file__).parent / "baselines" / "drag_and_drop.json"
+N_MOVES = 60
+
+
+class Draggable(KXDraggableBehavior, Label):
+    pass
+
+
+class Target(KXDragTargetBehavior, Widget):
+    pass
+
+
+class ReorderableBox(KXDragReorderBehavior, BoxLayout):
+    pass
+
+
+class LayoutCounter:
+    '''Counts the layout passes of every BoxLayout and GridLayout created while it is installed.'''
+
+    def __init__(self):
+        self.count = 0
+
+    @contextmanager
+    def install(self):
+        originals = [(cls, cls.do_layout) for cls in (BoxLayout, GridLayout)]
+
+        def wrap(do_layout):
+            @wraps(do_layout)  # Clock looks a method up by its name
+            def counting_do_layout(widget, *args):
+                self.count += 1
+                return do_layout(widget, *args)
+            return counting_do_layout
+
+        for cls, do_layout in originals:
+            cls.do_layout = wrap(do_layout)
+        try:
+            yield self
+        finally:
+            for cls, do_layout in originals:
+                cls.do_layout = do_layout
+
+
+def tick(n=1):
+    for __ in range(n):
+        Clock.tick()
+
+
+def measure_moves(touches, paths, layout_counter, trace_allocations):
+    '''
+    Moves the ``touches`` along the ``paths`` (one list of positions per touch), one step per frame, and returns
+    the measurements. As tracing allocations slows everything down, either the time or the allocations are
+    measured, not both.
+    '''
+    durations = []
+    allocations = []
+    layout_passes_before = layout_counter.count
+    perf_counter = time.perf_counter
+    if trace_allocations:
+        tracemalloc.start()
+    try:
+        for step in zip(*paths):
+            if trace_allocations:
+                tracemalloc.reset_peak()
+                base, __ = tracemalloc.get_traced_memory()
+            start = perf_counter()
+            for touch, pos in zip(touches, step):
+                touch.touch_move(*pos)
+            tick()
+            durations.append(perf_counter() - start)
+            if trace_allocations:
+                __, peak = tracemalloc.get_traced_memory()
+                allocations.append(peak - base)
+    finally:
+        if trace_allocations:
+            tracemalloc.stop()
+    n = len(touches)
+    if trace_allocations:
+        return {"alloc_bytes_per_move": statistics.fmean(allocations) / n}
+    return {
+        "moves": len(durations) * n,
+        "us_per_move_mean": statistics.fmean(durations) / n * 1e6,
+        "us_per_move_p95": sorted(durations)[int(len(durations) * .95) - 1] / n * 1e6,
+        "layout_passes": layout_counter.count - layout_passes_before,
+    }
+
+
+def line(start, end, n=N_MOVES):
+    (x1, y1), (x2, y2) = start, end
+    return [(x1 + (x2 - x1) * i / n, y1 + (y2 - y1) * i / n) for i in range(1, n + 1)]
+
+
+@contextmanager
+def on_window(widget):
+    Window.add_widget(widget)
+    try:
+        tick(3)
+        yield widget
+    finally:
+        Window.remove_widget(widget)
+        tick(3)
+
+
+def drag(draggables, ends, layout_counter, trace_allocations):
+    touches = [UnitTestTouch(*d.to_window(*d.center)) for d in draggables]
+    for t in touches:
+        t.touch_down()
+    tick(2)
+    result = measure_moves(
+        touches, [line(t.pos, end) for t, end in zip(touches, ends)], layout_counter, trace_allocations)
+    for t in touches:
+        t.touch_up()
+    tick(20)
+    return result
+
+
+def scenario_targets(n_targets, layout_counter, trace_allocations):
+    '''A draggable crossing a grid of ``n_targets`` drop targets.'''
+    root = BoxLayout()
+    source = BoxLayout(size_hint_x=.2)
+    source.add_widget(d := Draggable(text="D", drag_cls="bench", drag_timeout=0))
+    grid = GridLayout(cols=max(1, int(n_targets ** .5)))
+    for __ in range(n_targets):
+        grid.add_widget(Target(drag_classes=["bench", ]))
+    root.add_widget(source)
+    root.add_widget(grid)
+    with on_window(root):
+        return drag([d], [(grid.right - 1, grid.y + 1)], layout_counter, trace_allocations)
+
+
+def scenario_reorder(n_items, layout_counter, trace_allocations):
+    '''Dragging the first item of a ``n_items`` long reorderable list to its end.'''
+    box = ReorderableBox(orientation="vertical", drag_classes=["bench", ])
+    for i in range(n_items):
+        box.add_widget(Draggable(text=str(i), drag_cls="bench", drag_timeout=0))
+    with on_window(box):
+        return drag([box.children[-1]], [(box.center_x, box.y + 1)], layout_counter, trace_allocations)
+
+
+def scenario_multitouch(n_touches, layout_counter, trace_allocations):
+    '''``n_touches`` draggables dragged at the same time from one reorderable list to another.'''
+    root = BoxLayout()
+    left = ReorderableBox(orientation="vertical", drag_classes=["bench", ])
+    right = ReorderableBox(orientation="vertical", drag_classes=["bench", ], spacer_widgets=[
+        Widget() for __ in range(n_touches)])
+    for i in range(n_touches):
+        left.add_widget(Draggable(text=str(i), drag_cls="bench", drag_timeout=0))
+    root.add_widget(left)
+    root.add_widget(right)
+    with on_window(root):
+        ds = left.children[:]
+        ends = [(right.center_x, right.y + right.height * (i + .5) / n_touches) for i in range(n_touches)]
+        return drag(ds, ends, layout_counter, trace_allocations)
+
+
+SCENARIOS = {
+    "targets_1": (scenario_targets, 1),
+    "targets_10": (scenario_targets, 10),
+    "targets_100": (scenario_targets, 100),
+    "targets_1000": (scenario_targets, 1000),
+    "reorder_100": (scenario_reorder, 100),
+    "reorder_1000": (scenario_reorder, 1000),
+    "multitouch_5": (scenario_multitouch, 5),
+    "multitouch_10": (scenario_multitouch, 10),
+}
+
+# The metrics compared against the baselines.
+COMPARED = ("us_per_move_mean", "alloc_bytes_per_move", "layout_passes")
+
+
+def compare(results, baselines, tolerance) -> list[str]:
+    regressions = []
+    for name, result in results.items():
+        base = baselines.get(name)
+        if base is None:
+            continue
+        for key in COMPARED:
+            # A small absolute margin keeps the tiny values from being flagged because of noise.
+            if result[key] > base[key] * tolerance + 1:
+                regressions.append(f"{name}.{key}: {result[key]:.1f} (baseline {base[key]:.1f})")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("scenarios", nargs="*", help="The scenarios to run. Runs all of them if omitted.")
+    parser.add_argument("--save-baselines", action="store_true")
+    parser.add_argument("--check", action="store_true", help="Exit with 1 if something regressed.")
+    parser.add_argument("--tolerance", type=float, default=1.5)
+    args = parser.parse_args(argv)
+
+    names = args.scenarios or list(SCENARIOS)
+    results = {}
+    with LayoutCounter().install() as counter:
+        for name in names:
+            f, n = SCENARIOS[name]
+            results[name] = r = f(n, counter, False) | f(n, counter, True)
+            print(f"{name:>16}: {r['us_per_move_mean']:9.1f} us/move (p95 {r['us_per_move_p95']:9.1f})"
+                  f" {r['alloc_bytes_per_move']:10.0f} B/move {r['layout_passes']:6d} layout passes")
+
+    if args.save_baselines:
+        baselines = json.loads(BASELINES.read_text()) if BASELINES.exists() else {}
+        baselines.update(results)
+        BASELINES.parent.mkdir(exist_ok=True)
+        BASELINES.write_text(json.dumps(baselines, indent=2, sort_keys=True) + "\n")
+        return 0
+    if not BASELINES.exists():
+        return 0
+    regressions = compare(results, json.loads(BASELINES.read_text()), args.tolerance)
+    for r in regressions:
+        print("REGRESSION", r)
+    return 1 if (regressions and args.check) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
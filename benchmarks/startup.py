@@ -0,0 +1,215 @@
+'''
+Headless startup benchmark of the kivyx package.
+
+Reports, for every module that defines a component registered in ``kivyx.register_components()``, the time it
+takes to import it in a fresh interpreter, and, for every registered component, the time its first instance takes
+to construct and how many instances per second can be constructed after that. Each measurement runs in its own
+subprocess so that nothing is already imported or cached, and the median of ``--repeat`` runs is reported.
+
+.. code-block:: console
+
+    python benchmarks/startup.py                       # run and compare with the baselines
+    python benchmarks/startup.py --json results.json   # also write the results as JSON ('-' for stdout)
+    python benchmarks/startup.py --save-baselines      # run and overwrite the baselines
+    python benchmarks/startup.py --check               # exit with 1 if something regressed
+
+The import times exclude ``import kivy`` itself, which every Kivy app pays anyway. Behaviors are constructed
+mixed into the widget class they are meant for (see ``HOSTS``).
+'''
+
+import os
+os.environ.setdefault("KIVY_NO_CONSOLELOG", "1")
+os.environ.setdefault("KIVY_NO_ARGS", "1")
+
+import sys
+import json
+import time
+import statistics
+import platform
+import argparse
+import subprocess
+from pathlib import Path
+
+BASELINES = Path(__file__).parent / "baselines" / "startup.json"
+
+# The widget classes the behaviors are mixed into. The ones not listed here are mixed into a plain Widget.
+HOSTS = {
+    "KXBackgroundBatchBehavior": "kivy.uix.boxlayout.BoxLayout",
+    "KXDragReorderBehavior": "kivy.uix.boxlayout.BoxLayout",
+    "KXRecycleDragReorderBehavior": "kivy.uix.recycleboxlayout.RecycleBoxLayout",
+    "KXRecycleSwipe2DeleteBehavior": "kivy.uix.recycleboxlayout.RecycleBoxLayout",
+    "KXSwipe2DeleteBehavior": "kivy.uix.boxlayout.BoxLayout",
+    "KXSwipeActionsBehavior": "kivy.uix.boxlayout.BoxLayout",
+}
+
+
+def registered_components() -> dict[str, str]:
+    '''Returns ``{component name: module name, }`` of the components kivyx registers to the Factory.'''
+    import kivyx  # noqa: F401
+    from kivy.factory import Factory
+    return {
+        name: entry["module"] for name, entry in sorted(Factory.classes.items())
+        if (entry["module"] or "").startswith("kivyx.")
+    }
+
+
+# The functions prefixed with 'child_' run in a fresh interpreter, which prints what they return as JSON.
+def child_import(module_name):
+    import importlib
+    import kivy  # noqa: F401
+    n_modules_before = len(sys.modules)
+    start = time.perf_counter()
+    importlib.import_module(module_name)
+    duration = time.perf_counter() - start
+    window = sys.modules.get("kivy.core.window")
+    return {
+        "import_ms": duration * 1e3,
+        "new_modules": len(sys.modules) - n_modules_before,
+        "creates_window": window is not None and window.Window is not None,
+    }
+
+
+def child_construct(component_name, min_duration):
+    import importlib
+    from kivy.config import Config
+    Config.set("graphics", "maxfps", "0")  # keeps Clock.tick() from sleeping until the next frame
+    from kivy.clock import Clock
+    from kivy.factory import Factory
+    from kivy.uix.widget import Widget
+    import kivyx  # noqa: F401
+
+    cls = Factory.get(component_name)
+    if not issubclass(cls, Widget):
+        module_name, __, host_name = HOSTS.get(component_name, "kivy.uix.widget.Widget").rpartition(".")
+        host = getattr(importlib.import_module(module_name), host_name)
+        cls = type(component_name + "Host", (cls, host), {})
+    perf_counter = time.perf_counter
+
+    start = perf_counter()
+    cls()
+    first = perf_counter() - start
+    Clock.tick()
+
+    # The instances are thrown away right after being constructed, and the Clock ticks between the batches so
+    # that the callbacks they scheduled don't pile up. Only the construction is timed.
+    total = 0.
+    n = 0
+    while total < min_duration:
+        for __ in range(20):
+            start = perf_counter()
+            cls()
+            total += perf_counter() - start
+        n += 20
+        Clock.tick()
+    return {
+        "first_instance_ms": first * 1e3,
+        "instances_per_second": n / total,
+    }
+
+
+def run_child(*args) -> dict:
+    r = subprocess.run(
+        [sys.executable, __file__, "--child", *args],
+        capture_output=True, text=True, check=True,
+    )
+    return json.loads(r.stdout.strip().splitlines()[-1])
+
+
+def run_repeatedly(repeat, *args) -> dict:
+    '''Runs the child ``repeat`` times and returns the median of each numeric value.'''
+    runs = [run_child(*args) for __ in range(repeat)]
+    return {
+        key: (statistics.median(r[key] for r in runs) if isinstance(value, float) else value)
+        for key, value in runs[0].items()
+    }
+
+
+# The metrics compared against the baselines, and whether a higher value is better.
+COMPARED = (
+    ("import_ms", False),
+    ("first_instance_ms", False),
+    ("instances_per_second", True),
+)
+
+
+def compare(results, baselines, tolerance) -> list[str]:
+    regressions = []
+    for section in ("imports", "components"):
+        for name, result in results[section].items():
+            base = baselines.get(section, {}).get(name)
+            if base is None:
+                continue
+            for key, higher_is_better in COMPARED:
+                if key not in result or key not in base:
+                    continue
+                value = result[key]
+                # A small absolute margin keeps the tiny values from being flagged because of noise.
+                if (value < base[key] / tolerance) if higher_is_better else (value > base[key] * tolerance + 1):
+                    regressions.append(f"{name}.{key}: {value:.1f} (baseline {base[key]:.1f})")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("components", nargs="*", help="The components to measure. Measures all of them if omitted.")
+    parser.add_argument("--repeat", type=int, default=3, help="The number of runs each measurement is the median of.")
+    parser.add_argument("--duration", type=float, default=.3,
+                        help="The minimum time in seconds spent constructing instances of each component.")
+    parser.add_argument("--json", metavar="PATH", help="Write the results as JSON to PATH ('-' for stdout).")
+    parser.add_argument("--save-baselines", action="store_true")
+    parser.add_argument("--check", action="store_true", help="Exit with 1 if something regressed.")
+    parser.add_argument("--tolerance", type=float, default=1.5)
+    parser.add_argument("--child", nargs="+", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        kind, name = args.child[:2]
+        result = child_import(name) if kind == "import" else child_construct(name, float(args.child[2]))
+        print(json.dumps(result))
+        return 0
+
+    import kivy
+    components = registered_components()
+    names = args.components or list(components)
+    log = sys.stderr if args.json == "-" else sys.stdout
+    results = {
+        "environment": {
+            "python": platform.python_version(),
+            "kivy": kivy.__version__,
+            "machine": platform.machine(),
+        },
+        "imports": {},
+        "components": {},
+    }
+    for module_name in ["kivyx", *sorted({components[name] for name in names})]:
+        results["imports"][module_name] = r = run_repeatedly(args.repeat, "import", module_name)
+        print(f"{module_name:>36}: {r['import_ms']:8.1f} ms import {r['new_modules']:4d} new modules"
+              f"{'  (creates the Window)' if r['creates_window'] else ''}", file=log)
+    for name in names:
+        results["components"][name] = r = run_repeatedly(args.repeat, "construct", name, str(args.duration))
+        print(f"{name:>36}: {r['first_instance_ms']:8.2f} ms first instance"
+              f" {r['instances_per_second']:10.0f} instances/s", file=log)
+
+    if args.json == "-":
+        print(json.dumps(results, indent=2, sort_keys=True))
+    elif args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2, sort_keys=True) + "\n")
+
+    if args.save_baselines:
+        baselines = json.loads(BASELINES.read_text()) if BASELINES.exists() else {}
+        for section in ("imports", "components"):
+            baselines.setdefault(section, {}).update(results[section])
+        baselines["environment"] = results["environment"]
+        BASELINES.parent.mkdir(exist_ok=True)
+        BASELINES.write_text(json.dumps(baselines, indent=2, sort_keys=True) + "\n")
+        return 0
+    if not BASELINES.exists():
+        return 0
+    regressions = compare(results, json.loads(BASELINES.read_text()), args.tolerance)
+    for r in regressions:
+        print("REGRESSION", r, file=log)
+    return 1 if (regressions and args.check) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,4 @@
-__all__ = []
+__all__ = ("setup_events", )
 
 
 def immediate_call(f):
@@ -11,11 +11,15 @@ def register_components():
     r = Factory.register
 
     # Behaviors
+    r("KXBackgroundBatchBehavior", module="kivyx.uix.behaviors.backgroundbatch")
     r('KXDraggableBehavior', module="kivyx.uix.behaviors.draggable")
     r('KXDragReorderBehavior', module="kivyx.uix.behaviors.draggable")
     r('KXDragTargetBehavior', module="kivyx.uix.behaviors.draggable")
+    r('KXRecycleDragReorderBehavior', module="kivyx.uix.behaviors.draggable")
     r("KXMultiTapGestureRecognizer", module="kivyx.uix.behaviors.tap")
+    r("KXRecycleSwipe2DeleteBehavior", module="kivyx.uix.behaviors.swipe2delete")
     r("KXSwipe2DeleteBehavior", module="kivyx.uix.behaviors.swipe2delete")
+    r("KXSwipeActionsBehavior", module="kivyx.uix.behaviors.swipe2delete")
     r("KXTapGestureRecognizer", module="kivyx.uix.behaviors.tap")
     r("KXTouchRippleBehavior", module="kivyx.uix.behaviors.touchripple")
 
@@ -26,8 +30,20 @@ def register_components():
     r("KXSwitch", module="kivyx.uix.switch")
 
 
-@immediate_call
+_events_are_set_up = False
+
+
 def setup_events():
+    '''
+    Makes the :class:`~kivy.core.window.Window` put ``kivyx_exclusive_access`` and ``kivyx_end_event`` into the
+    ``ud`` of every touch. The kivyx widgets call this when they are created, and it is also called when the app
+    starts, so you only need to call it yourself if you use those keys without any kivyx widget.
+    Calling it more than once has no effect.
+    '''
+    global _events_are_set_up
+    if _events_are_set_up:
+        return
+    _events_are_set_up = True
     import types
     from kivy.core.window import Window
 
@@ -84,3 +100,14 @@ def setup_events():
 
     Window.fbind("on_touch_down", put_events)
     Window.fbind("on_touch_up", fire_end_event)
+
+
+@immediate_call
+def schedule_setup_events():
+    # Importing 'kivy.core.window' creates the Window, which is too expensive to do on import.
+    import sys
+    if (m := sys.modules.get("kivy.core.window")) is not None and m.Window is not None:
+        setup_events()
+        return
+    from kivy.base import EventLoop
+    EventLoop.fbind("on_start", lambda *args: setup_events())
@@ -0,0 +1,171 @@
+'''
+=======
+Latency
+=======
+
+Measures the touch-to-frame latency, the time from when a touch event happened (``touch.time_update``, or
+``touch.time_end`` for a release) to when the first frame after the kivyx widgets handled it is flipped onto the
+screen.
+
+.. code-block::
+
+    tracer = LatencyTracer()
+    tracer.start()
+    ...
+    tracer.stop()
+    for gesture, stats in tracer.report().items():
+        print(gesture, stats["count"], stats["p50"], stats["p95"], stats["p99"])
+
+The events are stamped by the following handlers, under the following gesture names:
+
+* ``"scroll"``: :class:`~kivyx.uix.scrollview.KXScrollView` moving its content along with a touch.
+* ``"drag"``: :class:`~kivyx.uix.behaviors.draggable.KXDraggableBehavior` following a touch.
+* ``"tap"``: :class:`~kivyx.uix.behaviors.tap.KXTapGestureRecognizer` dispatching ``on_tap``.
+* ``"multi_tap"``: :class:`~kivyx.uix.behaviors.tap.KXMultiTapGestureRecognizer` dispatching ``on_multi_tap``,
+  measured from the last tap. This includes the time it waits for another tap.
+
+Tracing is opt-in. While no tracer is running, stamping an event costs a function call.
+The latencies are accumulated in fixed-size histograms, so a tracer can run for as long as needed.
+'''
+
+__all__ = ("LatencyTracer", "LatencyHistogram", "stamp", )
+
+import time
+import math
+
+
+class LatencyHistogram:
+    '''
+    Counts latencies in bins of ``bin_width`` seconds. The latencies longer than ``bin_width * n_bins`` are
+    counted in one more bin.
+    '''
+    __slots__ = ("bin_width", "counts", "count", "total", "max", )
+
+    def __init__(self, bin_width, n_bins):
+        self.bin_width = bin_width
+        self.counts = [0] * (n_bins + 1)
+        self.count = 0
+        self.total = 0.
+        self.max = 0.
+
+    def add(self, latency, int=int, min=min):
+        counts = self.counts
+        counts[min(int(latency / self.bin_width), len(counts) - 1)] += 1
+        self.count += 1
+        self.total += latency
+        if latency > self.max:
+            self.max = latency
+
+    def percentile(self, p) -> float:
+        '''
+        Returns the latency that ``p`` percent of the latencies are equal to or shorter than, rounded up to the
+        upper edge of its bin. ``nan`` if nothing has been counted.
+        '''
+        if not self.count:
+            return math.nan
+        rank = max(1, math.ceil(self.count * p / 100.))
+        counts = self.counts
+        last = len(counts) - 1
+        cumulative = 0
+        for i, c in enumerate(counts):
+            cumulative += c
+            if cumulative >= rank:
+                return self.max if i == last else min((i + 1) * self.bin_width, self.max)
+        return self.max
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else math.nan
+
+
+class LatencyTracer:
+    '''
+    Collects the touch-to-frame latencies per gesture while it is running. Only one tracer runs at a time;
+    starting one stops the one that was running.
+
+    :param bin_width: The resolution of the histograms in seconds.
+    :param n_bins: The number of bins of each histogram.
+    :param time_source: Returns the current time, on the same clock as the touch timestamps.
+    '''
+
+    def __init__(self, *, bin_width=.0005, n_bins=1000, time_source=time.time):
+        self.bin_width = bin_width
+        self.n_bins = n_bins
+        self.time_source = time_source
+        self.histograms: dict[str, LatencyHistogram] = {}
+        self._pending = []  # [(gesture, timestamp), ]
+
+    @property
+    def is_running(self) -> bool:
+        return _active_tracer is self
+
+    def start(self):
+        global _active_tracer
+        if _active_tracer is self:
+            return
+        if _active_tracer is not None:
+            _active_tracer.stop()
+        from kivy.core.window import Window
+        Window.fbind("on_flip", self._on_flip)
+        _active_tracer = self
+
+    def stop(self):
+        global _active_tracer
+        if _active_tracer is not self:
+            return
+        from kivy.core.window import Window
+        Window.funbind("on_flip", self._on_flip)
+        _active_tracer = None
+        self._pending.clear()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def reset(self):
+        '''Discards everything collected so far.'''
+        self.histograms.clear()
+        self._pending.clear()
+
+    def _on_flip(self, *args):
+        pending = self._pending
+        if not pending:
+            return
+        now = self.time_source()
+        histograms = self.histograms
+        for gesture, timestamp in pending:
+            if (h := histograms.get(gesture)) is None:
+                histograms[gesture] = h = LatencyHistogram(self.bin_width, self.n_bins)
+            h.add(now - timestamp)
+        pending.clear()
+
+    def report(self) -> dict[str, dict[str, float]]:
+        '''
+        Returns ``{gesture: {"count": ..., "mean": ..., "p50": ..., "p95": ..., "p99": ..., "max": ...}, }``.
+        The latencies are in seconds.
+        '''
+        return {
+            gesture: {
+                "count": h.count,
+                "mean": h.mean,
+                "p50": h.percentile(50),
+                "p95": h.percentile(95),
+                "p99": h.percentile(99),
+                "max": h.max,
+            }
+            for gesture, h in sorted(self.histograms.items())
+        }
+
+
+_active_tracer: LatencyTracer = None
+
+
+def stamp(gesture: str, touch):
+    '''Called by the touch handlers when they have handled the latest event of the ``touch``.'''
+    tracer = _active_tracer
+    if tracer is not None:
+        time_end = touch.time_end
+        tracer._pending.append((gesture, time_end if time_end >= 0 else touch.time_update))
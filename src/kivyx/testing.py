@@ -0,0 +1,297 @@
+'''
+=======
+Testing
+=======
+
+A headless harness that drives kivyx widgets with synthetic touches.
+
+:class:`TouchDriver` replaces the time source of a :class:`~kivy.clock.ClockBase` with a virtual one, so that
+``Clock`` callbacks, ``ak.sleep()``, timeouts and the timestamps of the touches only depend on how far the driver
+advanced the time, not on how fast the machine is.
+The touches are dispatched through :meth:`kivy.base.EventLoopBase.post_dispatch_input`, just like the real ones,
+so the :class:`~kivy.core.window.Window` puts ``kivyx_exclusive_access`` and ``kivyx_end_event`` into them.
+
+.. code-block::
+
+    def test_something(kivy_clock):
+        driver = TouchDriver(kivy_clock)
+        with driver:
+            touch = driver.down(100, 100)
+            driver.frame()
+            driver.move(touch, 200, 100)
+            driver.wait(.5)
+            driver.up(touch)
+            driver.play(fling((100, 100), (400, 100)))
+            driver.play(merge(drag((0, 0), (100, 100)), multi_tap((300, 300), 3)))
+
+A gesture is an iterable of :class:`TouchSample` s in time order, which doesn't have to be a list, so it can be
+streamed from anywhere.
+'''
+
+__all__ = (
+    "TouchSample", "SyntheticTouch", "TouchInjector", "TouchDriver", "merge", "tap", "multi_tap", "drag", "fling",
+)
+
+from typing import NamedTuple
+from collections.abc import Iterable, Iterator
+import time
+import heapq
+import itertools
+
+from kivy.input.motionevent import MotionEvent
+
+from kivyx import setup_events
+
+
+class TouchSample(NamedTuple):
+    '''One event of a gesture.'''
+
+    time: float
+    '''The time in seconds, relative to the start of the gesture.'''
+
+    uid: int
+    '''Identifies the touch within the gesture. The samples of the same touch share it.'''
+
+    etype: str
+    '''``"begin"``, ``"update"`` or ``"end"``.'''
+
+    x: float
+    '''The X position in the window coordinates.'''
+
+    y: float
+    '''The Y position in the window coordinates.'''
+
+    button: str = ""
+    '''The mouse button such as ``"left"`` and ``"scrolldown"``. An empty string means it's not a mouse touch.'''
+
+
+class SyntheticTouch(MotionEvent):
+    '''A :class:`~kivy.input.motionevent.MotionEvent` whose timestamps come from a :class:`TouchInjector`.'''
+
+    def __init__(self, injector, x, y, button=""):
+        self._injector = injector
+        super().__init__("SyntheticTouch", next(_touch_ids), self._to_args(x, y), is_touch=True, type_id="touch")
+        self.profile = ["pos", "button"] if button else ["pos"]
+        if button:
+            self.button = button
+        self.time_start = self.time_update = injector.now
+
+    def _to_args(self, x, y):
+        win = self._injector.window
+        return {"x": x / (win.width - 1.0), "y": y / (win.height - 1.0)}
+
+    def depack(self, args):
+        self.sx = args["x"]
+        self.sy = args["y"]
+        super().depack(args)
+
+    def _move_to(self, x, y):
+        self.move(self._to_args(x, y))
+        self.time_update = self._injector.now
+
+
+_touch_ids = itertools.count(1)
+
+
+class _VirtualTime:
+    __slots__ = ("now", )
+
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class TouchInjector:
+    '''
+    Injects synthetic touches into the :class:`~kivy.core.window.Window`. Their timestamps are the current time,
+    the same as the real touches.
+    '''
+
+    def __init__(self):
+        from kivy.core.window import Window
+        setup_events()
+        self.window = Window
+
+    @property
+    def now(self) -> float:
+        return time.time()
+
+    def down(self, x, y, *, button="") -> SyntheticTouch:
+        touch = SyntheticTouch(self, x, y, button)
+        _dispatch("begin", touch)
+        return touch
+
+    def move(self, touch: SyntheticTouch, x, y):
+        touch._move_to(x, y)
+        _dispatch("update", touch)
+
+    def up(self, touch: SyntheticTouch):
+        touch.time_end = self.now
+        _dispatch("end", touch)
+
+    def dispatch_sample(self, s: TouchSample, touches: dict):
+        '''
+        Dispatches the touch event the ``s`` represents. ``touches`` is where the touches that are being pressed are
+        kept between the calls, and must be an empty dictionary at the start of a gesture.
+        '''
+        etype = s.etype
+        x = s.x
+        y = s.y
+        if etype == "begin":
+            touches[s.uid] = [self.down(x, y, button=s.button), x, y]
+        elif etype == "update":
+            entry = touches[s.uid]
+            self.move(entry[0], x, y)
+            entry[1:] = (x, y)
+        else:
+            touch, last_x, last_y = touches.pop(s.uid)
+            if (last_x, last_y) != (x, y):
+                self.move(touch, x, y)
+            self.up(touch)
+
+
+def _dispatch(etype, touch):
+    from kivy.base import EventLoop
+    EventLoop.post_dispatch_input(etype, touch)
+
+
+class TouchDriver(TouchInjector):
+    '''
+    A :class:`TouchInjector` that advances the ``clock`` one frame at a time. Use it as a context manager, or call
+    :meth:`install` and :meth:`uninstall`, to put the virtual time in and out of the ``clock``.
+
+    :param clock: The clock to drive. Typically the one the ``kivy_clock`` fixture provides. Defaults to
+        :data:`kivy.clock.Clock`.
+    :param frame_duration: How much the virtual time advances per frame.
+    :param draw: Whether each frame also draws the Window, which a real frame does.
+    '''
+
+    def __init__(self, clock=None, *, frame_duration=1 / 60, draw=False):
+        if clock is None:
+            from kivy.clock import Clock as clock
+        super().__init__()
+        self.clock = clock
+        self.frame_duration = frame_duration
+        self.draw = draw
+        self.n_frames = 0  # the number of frames this driver has advanced
+        self._time = None
+        self._frame_time = 0.
+        self._saved = None
+
+    @property
+    def now(self) -> float:
+        '''The current virtual time.'''
+        return self._time.now
+
+    def install(self):
+        clock = self.clock
+        # The virtual time continues from the current time so that the events scheduled before stay in order.
+        self._time = vt = _VirtualTime(clock.time())
+        self._frame_time = vt.now
+        self._saved = (clock.__dict__.get("time"), clock._max_fps)
+        clock.time = vt
+        clock._max_fps = 0  # the clock would wait forever for the virtual time to advance
+        return self
+
+    def uninstall(self):
+        clock = self.clock
+        time, clock._max_fps = self._saved
+        if time is None:
+            del clock.time
+        else:
+            clock.time = time
+        self._saved = None
+
+    def __enter__(self):
+        return self.install()
+
+    def __exit__(self, *args):
+        self.uninstall()
+
+    def frame(self, n=1):
+        '''Advances the time by ``n`` frames.'''
+        clock = self.clock
+        vt = self._time
+        window = self.window
+        for __ in range(n):
+            # The frames stay on a fixed time grid even if touches are dispatched in between them.
+            self._frame_time = t = self._frame_time + self.frame_duration
+            vt.now = max(t, vt.now)
+            clock.tick()
+            if self.draw:
+                clock.tick_draw()
+                if window.canvas.needs_redraw:
+                    window.dispatch("on_draw")
+                    window.dispatch("on_flip")
+            self.n_frames += 1
+
+    def wait(self, duration):
+        '''Advances the time by as many frames as it takes for ``duration`` seconds to elapse.'''
+        self.frame(max(1, round(duration / self.frame_duration)))
+
+    def play(self, samples: Iterable[TouchSample], *, speed=1.):
+        '''
+        Replays the ``samples``, advancing the frames in between so that each sample is dispatched at its time
+        divided by ``speed``. The samples are consumed lazily, and one more frame is advanced after the last one.
+        The touches that are still pressed at the end stay pressed.
+        '''
+        touches = {}
+        frame_duration = self.frame_duration
+        start = self.now
+        vt = self._time
+        dispatch_sample = self.dispatch_sample
+        for s in samples:
+            t = start + s.time / speed
+            while t >= self._frame_time + frame_duration:
+                self.frame()
+            vt.now = max(t, vt.now)
+            dispatch_sample(s, touches)
+        self.frame()
+
+
+def merge(*gestures: Iterable[TouchSample]) -> Iterator[TouchSample]:
+    '''
+    Interleaves the gestures by time so that they are performed at the same time. Each uid is paired with the
+    index of its gesture so that the touches of different gestures don't mix up.
+    '''
+    def offset_uids(gesture, offset):
+        for s in gesture:
+            yield s._replace(uid=(s.uid, offset))
+    return heapq.merge(*(offset_uids(g, i) for i, g in enumerate(gestures)), key=lambda s: s.time)
+
+
+def tap(pos, *, duration=.05, start=0., uid=0, button="") -> list[TouchSample]:
+    x, y = pos
+    return [
+        TouchSample(start, uid, "begin", x, y, button),
+        TouchSample(start + duration, uid, "end", x, y, button),
+    ]
+
+
+def multi_tap(pos, n_taps, *, interval=.15, duration=.05, start=0.) -> list[TouchSample]:
+    '''``n_taps`` taps at the same position, each one starting ``interval`` seconds after the previous one.'''
+    return [s for i in range(n_taps) for s in tap(pos, duration=duration, start=start + interval * i, uid=i)]
+
+
+def drag(start_pos, end_pos, *, duration=.5, rate=60, hold=0., start=0., uid=0) -> list[TouchSample]:
+    '''
+    A touch that moves from ``start_pos`` to ``end_pos`` at a constant speed in ``duration`` seconds, reporting
+    its position ``rate`` times per second. It stays still for ``hold`` seconds before it starts moving and
+    before it is released.
+    '''
+    (x1, y1), (x2, y2) = start_pos, end_pos
+    n = max(1, round(duration * rate))
+    samples = [TouchSample(start, uid, "begin", x1, y1)]
+    t = start + hold
+    for i in range(1, n + 1):
+        p = i / n
+        samples.append(TouchSample(t + duration * p, uid, "update", x1 + (x2 - x1) * p, y1 + (y2 - y1) * p))
+    samples.append(TouchSample(t + duration + hold, uid, "end", x2, y2))
+    return samples
+
+
+def fling(start_pos, end_pos, *, duration=.1, rate=120, start=0., uid=0) -> list[TouchSample]:
+    '''A quick :func:`drag` that is released while moving, which makes scrollable widgets keep scrolling.'''
+    return drag(start_pos, end_pos, duration=duration, rate=rate, start=start, uid=uid)
@@ -0,0 +1,209 @@
+'''
+===========
+Touch Trace
+===========
+
+Records the touches the :class:`~kivy.core.window.Window` receives into a compact binary file, and replays them.
+
+.. code-block::
+
+    recorder = TouchTraceRecorder("session.kxtt")
+    recorder.start()
+    ...
+    recorder.stop()
+
+    with TouchTrace("session.kxtt") as trace:
+        print(len(trace), "events", trace.duration, "seconds")
+
+        # in a running app, in real time or faster
+        await play_touch_trace(trace, speed=2.)
+
+        # headlessly, with a virtual clock
+        with TouchDriver(kivy_clock) as driver:
+            driver.play(trace, speed=10.)
+
+A file consists of a 16 bytes header followed by a sequence of 24 bytes records, one per touch down, move and up.
+:class:`TouchTrace` memory-maps the file and iterates over its records one at a time, so a trace of any length can
+be replayed without being loaded into Python objects as a whole.
+
+=======  ========  ==========================================================================================
+offset   type      record field
+=======  ========  ==========================================================================================
+0        uint8     event type, 0: down, 1: move, 2: up
+1        uint8     profile bits, see ``PROFILE_BITS``
+2        uint8     button, the index in ``BUTTONS``
+3                  (padding)
+4        uint32    touch uid
+8        float64   ``touch.time_update`` (``touch.time_end`` for an up) from the first recorded event
+16       float32   X position in the window coordinates
+20       float32   Y position in the window coordinates
+=======  ========  ==========================================================================================
+'''
+
+__all__ = ("TouchTraceRecorder", "TouchTrace", "play_touch_trace", "BUTTONS", "PROFILE_BITS", )
+
+import mmap
+import struct
+from collections.abc import Iterator
+
+import asynckivy as ak
+
+from kivyx import setup_events
+from kivyx.testing import TouchSample, TouchInjector
+
+_MAGIC = b"KXTT"
+_VERSION = 1
+_HEADER = struct.Struct("<4sHHff")  # magic, version, record size, window width, window height
+_RECORD = struct.Struct("<BBBxIdff")
+_ETYPES = ("begin", "update", "end", )
+
+BUTTONS = ("", "left", "right", "middle", "scrollup", "scrolldown", "scrollleft", "scrollright", )
+'''The mouse buttons a trace can hold. Any other button is recorded as ``""``.'''
+
+PROFILE_BITS = ("pos", "button", "pressure", "angle", "shape", "markerid", )
+'''The ``touch.profile`` entries that are recorded, from the least significant bit.'''
+
+_BUTTON_INDICES = {b: i for i, b in enumerate(BUTTONS)}
+
+
+class TouchTraceRecorder:
+    '''
+    Writes every touch down, move and up the :class:`~kivy.core.window.Window` receives to the file at ``path``.
+    The writes are buffered, and the file is complete after :meth:`stop`.
+    '''
+
+    def __init__(self, path):
+        self.path = path
+        self._file = None
+        self._t0 = None
+
+    @property
+    def is_recording(self) -> bool:
+        return self._file is not None
+
+    def start(self):
+        if self._file is not None:
+            return
+        from kivy.core.window import Window
+        setup_events()
+        self._file = file = open(self.path, "wb")
+        file.write(_HEADER.pack(_MAGIC, _VERSION, _RECORD.size, *Window.size))
+        self._t0 = None
+        f = Window.fbind
+        f("on_touch_down", self._on_touch_down)
+        f("on_touch_move", self._on_touch_move)
+        f("on_touch_up", self._on_touch_up)
+
+    def stop(self):
+        if self._file is None:
+            return
+        from kivy.core.window import Window
+        f = Window.funbind
+        f("on_touch_down", self._on_touch_down)
+        f("on_touch_move", self._on_touch_move)
+        f("on_touch_up", self._on_touch_up)
+        self._file.close()
+        self._file = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def _on_touch_down(self, w, t):
+        self._write(0, t)
+
+    def _on_touch_move(self, w, t):
+        self._write(1, t)
+
+    def _on_touch_up(self, w, t):
+        self._write(2, t)
+
+    def _write(self, etype, t, pack=_RECORD.pack, button_indices=_BUTTON_INDICES):
+        time = t.time_end if (etype == 2 and t.time_end >= 0) else t.time_update
+        if self._t0 is None:
+            self._t0 = time
+        profile = t.profile
+        bits = 0
+        for i, name in enumerate(PROFILE_BITS):
+            if name in profile:
+                bits |= 1 << i
+        button = button_indices.get(t.button, 0) if "button" in profile else 0
+        self._file.write(pack(etype, bits, button, t.uid & 0xFFFFFFFF, time - self._t0, t.x, t.y))
+
+
+class TouchTrace:
+    '''
+    A trace file that :class:`TouchTraceRecorder` wrote, memory-mapped. Iterating over it yields
+    :class:`~kivyx.testing.TouchSample` s, one record at a time. The records are read from the map only when
+    they are needed.
+    '''
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            try:
+                self._mmap = m = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # an empty file cannot be mapped
+                raise ValueError(f"{path!r} is not a touch trace") from None
+        if len(m) < _HEADER.size:
+            m.close()
+            raise ValueError(f"{path!r} is not a touch trace")
+        magic, version, record_size, width, height = _HEADER.unpack_from(m)
+        if magic != _MAGIC or version != _VERSION or record_size != _RECORD.size:
+            m.close()
+            raise ValueError(f"{path!r} is not a touch trace of version {_VERSION}")
+        self.window_size = (width, height)
+        '''The size of the window the trace was recorded in.'''
+        # A record that was being written when the app died is ignored.
+        self._n = (len(m) - _HEADER.size) // _RECORD.size
+
+    def close(self):
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self):
+        return self._n
+
+    @property
+    def duration(self) -> float:
+        '''The time between the first and the last event, in seconds.'''
+        if not self._n:
+            return 0.
+        return _RECORD.unpack_from(self._mmap, _HEADER.size + (self._n - 1) * _RECORD.size)[4]
+
+    def __iter__(self) -> Iterator[TouchSample]:
+        buttons = BUTTONS
+        etypes = _ETYPES
+        button_bit = 1 << PROFILE_BITS.index("button")
+        view = memoryview(self._mmap)[_HEADER.size:_HEADER.size + self._n * _RECORD.size]
+        try:
+            for etype, bits, button, uid, time, x, y in _RECORD.iter_unpack(view):
+                yield TouchSample(time, uid, etypes[etype], x, y, buttons[button] if bits & button_bit else "")
+        finally:
+            view.release()
+
+
+async def play_touch_trace(trace, *, speed=1.):
+    '''
+    Replays the ``trace`` into the :class:`~kivy.core.window.Window`, ``speed`` times faster than it was recorded.
+    Each frame dispatches all the events that are due by then. Cancelling the task leaves the touches that were
+    being pressed as they are.
+    '''
+    injector = TouchInjector()
+    dispatch_sample = injector.dispatch_sample
+    touches = {}
+    elapsed = 0.
+    samples = iter(trace)
+    s = next(samples, None)
+    while s is not None:
+        elapsed += (await ak.sleep(0)) * speed
+        while s is not None and s.time <= elapsed:
+            dispatch_sample(s, touches)
+            s = next(samples, None)
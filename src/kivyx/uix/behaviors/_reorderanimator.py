@@ -0,0 +1,79 @@
+__all__ = ()
+
+from kivy.clock import Clock
+from kivy.graphics import Translate
+import asynckivy as ak
+
+
+class _ReorderAnimator:
+    '''
+    Slides the children of a layout from where they were drawn to where the layout put them, such as the ones
+    displaced by the spacers of :class:`~kivyx.uix.behaviors.draggable.KXDragReorderBehavior` and the ones
+    following the items :class:`~kivyx.uix.behaviors.swipe2delete.KXRecycleSwipe2DeleteBehavior` deleted.
+    The offsets are applied through :class:`~kivy.graphics.Translate` instructions, so no extra layout pass
+    happens, and all the animations are driven by a single per-frame callback that stops when no animation is
+    left.
+    '''
+    __slots__ = ("_anims", "_clock_event", "__weakref__", )
+
+    def __init__(self):
+        # widget -> [translate, start_x, start_y, elapsed_time, duration, transform_context_manager]
+        self._anims = {}
+        self._clock_event = None
+
+    @property
+    def is_active(self) -> bool:
+        return bool(self._anims)
+
+    def is_animating(self, widget) -> bool:
+        return widget in self._anims
+
+    def visual_pos(self, widget) -> tuple:
+        '''Returns the position where the widget is currently drawn (in its parent's coordinates).'''
+        x, y = widget.pos
+        if (a := self._anims.get(widget)) is None:
+            return (x, y)
+        tx, ty = a[0].xy
+        return (x + tx, y + ty)
+
+    def animate(self, widgets, old_positions, duration, abs=abs):
+        '''
+        Starts sliding each of the ``widgets`` from the corresponding ``old_positions`` to its current position.
+        The ones already sliding restart from where they are drawn.
+        '''
+        anims = self._anims
+        for w, (ox, oy) in zip(widgets, old_positions):
+            dx = ox - w.x
+            dy = oy - w.y
+            if (a := anims.get(w)) is None:
+                if (not duration) or (abs(dx) < .5 and abs(dy) < .5):
+                    continue
+                cm = ak.transform(w, use_outer_canvas=True)
+                cm.__enter__().add(translate := Translate(dx, dy))
+                anims[w] = [translate, dx, dy, 0., duration, cm]
+            elif not duration:
+                del anims[w]
+                a[5].__exit__(None, None, None)
+            else:
+                a[0].xy = (dx, dy)
+                a[1:5] = (dx, dy, 0., duration)
+        if anims and self._clock_event is None:
+            self._clock_event = Clock.schedule_interval(self._update, 0)
+
+    def _update(self, dt):
+        anims = self._anims
+        for w, a in tuple(anims.items()):
+            elapsed = a[3] = a[3] + dt
+            p = elapsed / a[4]
+            if p >= 1.:
+                del anims[w]
+                a[5].__exit__(None, None, None)
+                continue
+            f = (1. - p) * (1. - p)  # out_quad
+            a[0].xy = (a[1] * f, a[2] * f)
+        if not anims:
+            self._clock_event = None
+            return False
+
+
+_reorder_animator = _ReorderAnimator()
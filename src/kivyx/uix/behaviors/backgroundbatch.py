@@ -0,0 +1,157 @@
+'''
+================
+Background Batch
+================
+
+:class:`KXBackgroundBatchBehavior` draws the backgrounds of all the :class:`~kivyx.uix.button.KXButton` and
+:class:`~kivyx.uix.button.KXMultiTapButton` children of a layout as a single :class:`~kivy.graphics.Mesh`,
+instead of each button drawing its own.
+
+.. code-block::
+
+    class BatchedBoxLayout(KXBackgroundBatchBehavior, BoxLayout):
+        pass
+
+    layout = BatchedBoxLayout(orientation="vertical")
+    for i in range(300):
+        layout.add_widget(KXButton(text=str(i)))
+
+The backgrounds are drawn in the layout's ``canvas.before``, thus the layout must share its coordinate system
+with its children (a ``RelativeLayout`` cannot be used).
+While being a child of the layout, a button draws its ripples with the ``"shader"``
+:attr:`~kivyx.uix.behaviors.touchripple.KXTouchRippleBehavior.ripple_renderer`, as in
+:attr:`~kivyx.uix.button.KXButton.stencil_free` mode.
+'''
+__all__ = ("KXBackgroundBatchBehavior", )
+
+from kivy.clock import Clock
+from kivy.graphics import RenderContext, Mesh
+
+from kivyx.uix.button import _ButtonBackground, _CORNER_RADIUS
+
+_VS = '''
+$HEADER$
+attribute vec2 vHalfSize;
+attribute vec4 vColor;
+varying vec2 half_size;
+
+void main(void) {
+    frag_color = vColor;
+    tex_coord0 = vTexCoords0;
+    half_size = vHalfSize;
+    gl_Position = projection_mat * modelview_mat * vec4(vPosition, 0.0, 1.0);
+}
+'''
+
+_FS = '''
+$HEADER$
+uniform float corner_radius;
+varying vec2 half_size;
+
+void main(void) {
+    // 'tex_coord0' is the offset from the center of the background
+    float r = min(corner_radius, min(half_size.x, half_size.y));
+    vec2 q = abs(tex_coord0) - (half_size - r);
+    float d = length(max(q, 0.0)) + min(max(q.x, q.y), 0.0) - r;
+    gl_FragColor = vec4(frag_color.rgb, frag_color.a * clamp(0.5 - d, 0.0, 1.0));
+}
+'''
+
+_VERTEX_FORMAT = [
+    (b'vPosition', 2, 'float'),
+    (b'vTexCoords0', 2, 'float'),
+    (b'vHalfSize', 2, 'float'),
+    (b'vColor', 4, 'float'),
+]
+_N = 40  # the number of floats per background (4 vertices * 10 floats)
+_OBSERVED_PROPERTIES = ("pos", "size", "opacity", "disabled", "background_color", "background_disabled_color", )
+
+
+class KXBackgroundBatchBehavior:
+    '''
+    Draws the backgrounds of the button children in one draw call. Only the vertices of the buttons that moved or
+    changed their colors are rewritten, and the mesh is uploaded at most once per frame.
+    '''
+
+    def __init__(self, **kwargs):
+        self.__buttons = []  # the buttons in the order of their slots in the mesh
+        self.__slots = {}  # {button: slot index, }
+        self.__uids = {}  # {button: binding uids, }
+        self.__vertices = []
+        self.__dirty = set()
+        self.__n_indexed = 0
+        self.__rc = rc = RenderContext(vs=_VS, fs=_FS, use_parent_projection=True, use_parent_modelview=True)
+        rc['corner_radius'] = _CORNER_RADIUS
+        with rc:
+            self.__mesh = Mesh(fmt=_VERTEX_FORMAT, mode='triangles')
+        self.__trigger_update = Clock.create_trigger(self.__update, -1)
+        super().__init__(**kwargs)
+        self.canvas.before.add(rc)
+
+    def add_widget(self, widget, *args, **kwargs):
+        super().add_widget(widget, *args, **kwargs)
+        if isinstance(widget, _ButtonBackground) and widget not in self.__slots:
+            self.__register(widget)
+
+    def remove_widget(self, widget, *args, **kwargs):
+        if widget in self.__slots:
+            self.__unregister(widget)
+        super().remove_widget(widget, *args, **kwargs)
+
+    def __register(self, button):
+        slots = self.__slots
+        slots[button] = len(self.__buttons)
+        self.__buttons.append(button)
+        self.__vertices.extend((0., ) * _N)
+        f = button.fbind
+        on_change = self.__on_button_change
+        self.__uids[button] = [(name, f(name, on_change)) for name in _OBSERVED_PROPERTIES]
+        button._set_background_batched(True)
+        on_change(button)
+
+    def __unregister(self, button):
+        # Moves the last background into the slot of the removed one so that no other slot needs to be rewritten.
+        slot = self.__slots.pop(button)
+        buttons = self.__buttons
+        vertices = self.__vertices
+        last = buttons.pop()
+        if last is not button:
+            buttons[slot] = last
+            self.__slots[last] = slot
+            vertices[slot * _N:(slot + 1) * _N] = vertices[-_N:]
+        del vertices[-_N:]
+        self.__dirty.discard(button)
+        for name, uid in self.__uids.pop(button):
+            button.unbind_uid(name, uid)
+        button._set_background_batched(False)
+        self.__trigger_update()
+
+    # Python's name mangling is weird. The methods passed to the Clock or to 'fbind()' cannot be named '__xxx'.
+    def _KXBackgroundBatchBehavior__on_button_change(self, button, *args):
+        self.__dirty.add(button)
+        self.__trigger_update()
+
+    def _KXBackgroundBatchBehavior__update(self, dt):
+        vertices = self.__vertices
+        slots = self.__slots
+        for button in self.__dirty:
+            x, y = button.pos
+            w, h = button.size
+            hw = w / 2.
+            hh = h / 2.
+            r, g, b, a = button.background_disabled_color if button.disabled else button.background_color
+            a *= button.opacity
+            i = slots[button] * _N
+            vertices[i:i + _N] = (
+                x, y, -hw, -hh, hw, hh, r, g, b, a,
+                x + w, y, hw, -hh, hw, hh, r, g, b, a,
+                x + w, y + h, hw, hh, hw, hh, r, g, b, a,
+                x, y + h, -hw, hh, hw, hh, r, g, b, a,
+            )
+        self.__dirty.clear()
+        mesh = self.__mesh
+        mesh.vertices = vertices
+        n = len(self.__buttons)
+        if n != self.__n_indexed:
+            self.__n_indexed = n
+            mesh.indices = [i for j in range(0, n * 4, 4) for i in (j, j + 1, j + 2, j + 2, j + 3, j)]
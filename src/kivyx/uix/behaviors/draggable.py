@@ -1,35 +1,43 @@
 __all__ = (
     "DragTarget", "KXDraggableBehavior", "KXDragTargetBehavior", "KXDragReorderBehavior",
-    "ongoing_drags", "save_widget_state", "restore_widget_state",
+    "KXRecycleDragReorderBehavior",
+    "ongoing_drags", "save_widget_state", "restore_widget_state", "WidgetState", "DragRegistry", "drag_registry",
 )
 
 import types
+from bisect import bisect_left
 from typing import Union, TypeAlias
 from inspect import isawaitable
 from dataclasses import dataclass
-from copy import deepcopy
 from functools import partial
+from contextlib import nullcontext, contextmanager
 
 from kivy.properties import (
     BooleanProperty, ListProperty, StringProperty, NumericProperty, OptionProperty, AliasProperty,
-    ObjectProperty,
+    ObjectProperty, ColorProperty,
 )
 from kivy.clock import Clock
+from kivy.event import EventDispatcher
 from kivy.utils import rgba
-from kivy.graphics import Color, Rectangle
+from kivy.metrics import dp
+from kivy.graphics import Color, Rectangle, Translate, PushMatrix, PopMatrix, InstructionGroup
 from kivy.core.window import Window, WindowBase
 from kivy.uix.widget import Widget
 from kivy.uix.scrollview import ScrollView
 from asyncgui import _current_task, _wait_args_0
 import asynckivy as ak
 
+from kivyx import setup_events
+from kivyx.latency import stamp
 from kivyx.touch_filters import is_opos_colliding_and_not_wheel
+from kivyx.uix.scrollview import _autoscrollable_views
+from kivyx.uix.behaviors._reorderanimator import _reorder_animator
 
 Wow: TypeAlias = Union[WindowBase, Widget]  # Window or Widget
-DragTarget: TypeAlias = Union['KXDragTargetBehavior', 'KXDragReorderBehavior']
+DragTarget: TypeAlias = Union['KXDragTargetBehavior', 'KXDragReorderBehavior', 'KXRecycleDragReorderBehavior']
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, eq=False)
 class DragContext:
     '''
     A dataclass that holds information about a drag.
@@ -53,10 +61,17 @@ class DragContext:
     (in window coordinates).
     '''
 
-    original_state: dict = None
+    original_state: 'WidgetState' = None
     '''
     (read-only) The sizing and positioning state of the draggable at the moment the drag starts.
     This can be passed to :func:`restore_widget_state`.
+    None if the :attr:`KXDraggableBehavior.drag_mode` is "transform", as the draggable stays where it is.
+    '''
+
+    translate: Translate = None
+    '''
+    (read-only) The :class:`~kivy.graphics.Translate` instruction that moves the draggable during the drag.
+    None unless the :attr:`KXDraggableBehavior.drag_mode` is "transform".
     '''
 
     released_on: Union[None, DragTarget] = None
@@ -64,6 +79,23 @@ class DragContext:
     (read-only) The widget where the draggable is released.
     '''
 
+    group: tuple = ()
+    '''
+    (read-only) The other draggables that are dragged together with the :attr:`draggable`.
+    Empty unless :attr:`KXDraggableBehavior.drag_group` is set. They are removed from their parents during
+    the drag, and the ones that are not added to any widget by the drop target are put back where they were.
+    '''
+
+    group_states: tuple = ()
+    '''
+    (read-only) The :func:`save_widget_state` of each :attr:`group` member at the moment the drag starts.
+    '''
+
+    @property
+    def draggables(self) -> tuple:
+        '''(read-only) The :attr:`draggable` followed by the :attr:`group` members.'''
+        return (self.draggable, *self.group)
+
 
 _shallow_copyable_property_names = (
     'x', 'y', 'width', 'height',
@@ -73,7 +105,56 @@ _shallow_copyable_property_names = (
 )
 
 
-def save_widget_state(widget, *, ignore_parent=False) -> dict:
+class WidgetState:
+    '''
+    A snapshot of the sizing and positioning properties of a widget, and optionally of where it is in the
+    widget tree. Use :func:`save_widget_state` and :func:`restore_widget_state` to create and apply it.
+
+    Every value it holds is immutable (``pos_hint`` is kept as a tuple of its items), so no deep copy is made
+    on either side, and restoring it only touches the properties that differ from the snapshot.
+    '''
+    __slots__ = _shallow_copyable_property_names + ('pos_hint', 'has_parent', 'parent', 'index', )
+
+    def __init__(self, widget, *, ignore_parent=False):
+        w = widget.__self__
+        setattr_ = setattr
+        getattr_ = getattr
+        for name in _shallow_copyable_property_names:
+            setattr_(self, name, getattr_(w, name))
+        self.pos_hint = tuple(w.pos_hint.items())
+        self.has_parent = not ignore_parent
+        self.parent = parent = None if ignore_parent else w.parent
+        self.index = None if parent is None else parent.children.index(w)
+
+    def restore(self, widget, *, ignore_parent=False):
+        w = widget.__self__
+        setattr_ = setattr
+        getattr_ = getattr
+        for name in _shallow_copyable_property_names:
+            v = getattr_(self, name)
+            if getattr_(w, name) != v:
+                setattr_(w, name, v)
+        if tuple(w.pos_hint.items()) != (pos_hint := self.pos_hint):
+            w.pos_hint = dict(pos_hint)
+        if ignore_parent or not self.has_parent:
+            return
+        parent = self.parent
+        if (cur_parent := w.parent) is not None:
+            if cur_parent is parent and parent is not Window:
+                children = parent.children
+                index = self.index
+                if index < len(children) and children[index] is w:
+                    return
+            cur_parent.remove_widget(w)
+        if parent is None:
+            return
+        if parent is Window:
+            parent.add_widget(w)  # 'Window.add_widget()' does not have a 'index' parameter
+        else:
+            parent.add_widget(w, index=self.index)
+
+
+def save_widget_state(widget, *, ignore_parent=False) -> WidgetState:
     '''
     Copies and returns the values of sizing and positioning properties of a widget.
 
@@ -81,20 +162,10 @@ def save_widget_state(widget, *, ignore_parent=False) -> dict:
 
         state = save_widget_state(widget)
     '''
-    w = widget.__self__
-    getattr_ = getattr
-    state = {name: getattr_(w, name) for name in _shallow_copyable_property_names}
-    state['pos_hint'] = deepcopy(w.pos_hint)
-    if ignore_parent:
-        return state
-    parent = w.parent
-    state['parent'] = parent
-    if parent is not None:
-        state['index'] = parent.children.index(w)
-    return state
+    return WidgetState(widget, ignore_parent=ignore_parent)
 
 
-def restore_widget_state(widget, state: dict, *, ignore_parent=False):
+def restore_widget_state(widget, state: WidgetState, *, ignore_parent=False):
     '''
     .. code-blck::
 
@@ -102,22 +173,78 @@ def restore_widget_state(widget, state: dict, *, ignore_parent=False):
         ...
         restore_widget_state(widget, state)
     '''
-    w = widget.__self__
-    setattr_ = setattr
-    for name in _shallow_copyable_property_names:
-        setattr_(w, name, state[name])
-    w.pos_hint = deepcopy(state['pos_hint'])
-    if ignore_parent or 'parent' not in state:
-        return
-    if w.parent is not None:
-        w.parent.remove_widget(w)
-    parent = state['parent']
-    if parent is None:
-        return
-    if parent is Window:
-        parent.add_widget(w)  # 'Window.add_widget()' does not have a 'index' parameter
-    else:
-        parent.add_widget(w, index=state['index'])
+    state.restore(widget, ignore_parent=ignore_parent)
+
+
+def _detach_draggable(ctx: DragContext):
+    '''
+    Removes the draggable from its current parent, and brings back the size hints it had before the drag started.
+    '''
+    d = ctx.draggable
+    d.parent.remove_widget(d)
+    if (os := ctx.original_state) is not None:
+        d.size_hint_x = os.size_hint_x
+        d.size_hint_y = os.size_hint_y
+        d.pos_hint = dict(os.pos_hint)
+
+
+def _detach_group(draggable) -> tuple[tuple, tuple]:
+    '''
+    Removes the members of ``draggable.drag_group`` from their parents, and returns them and their states.
+    The states are saved one by one right before each removal, so restoring them in the reverse order brings
+    every member back to its original index.
+    '''
+    group = []
+    states = []
+    d = draggable.__self__
+    for m in draggable.drag_group or ():
+        m = m.__self__
+        if m is d or m.parent is None or m.is_being_dragged or m in group:
+            continue
+        states.append(save_widget_state(m))
+        m.parent.remove_widget(m)
+        group.append(m)
+    return tuple(group), tuple(states)
+
+
+def _restore_group(ctx: DragContext):
+    '''Puts the group members that have not been added to any widget back where they were.'''
+    for m, state in zip(reversed(ctx.group), reversed(ctx.group_states)):
+        if m.parent is None:
+            restore_widget_state(m, state)
+
+
+_GROUP_STACK_DEPTH = 3
+'''How many group members are drawn behind the draggable.'''
+
+
+@contextmanager
+def _draw_group_as_stack(draggable, group, container: InstructionGroup, index):
+    '''
+    Draws the first few members of a group behind the draggable like a stack of cards, reusing their canvases.
+    The whole stack is placed by a single :class:`~kivy.graphics.Translate` that follows the draggable, so
+    the cost of moving it does not depend on the size of the group.
+    '''
+    stack = InstructionGroup()
+    stack.add(PushMatrix())
+    stack.add(translate := Translate())
+    offset = dp(4)
+    shown = group[:_GROUP_STACK_DEPTH]
+    for depth in range(len(shown), 0, -1):
+        m = shown[depth - 1]
+        stack.add(PushMatrix())
+        stack.add(Translate(depth * offset - m.x, -depth * offset - m.y))
+        stack.add(m.canvas)
+        stack.add(PopMatrix())
+    stack.add(PopMatrix())
+    container.insert(index, stack)
+    try:
+        with ak.sync_attr((draggable, "pos"), (translate, "xy")):
+            yield
+    finally:
+        container.remove(stack)
+        # Members' canvases must leave the stack before they are added to any widget.
+        stack.clear()
 
 
 def _create_spacer(**kwargs):
@@ -154,6 +281,29 @@ class KXDraggableBehavior:
     drag_state = OptionProperty(None, options=('started', 'succeeded', 'failed', 'cancelled'), allownone=True)
     '''(read-only)'''
 
+    drag_mode = OptionProperty("reparent", options=("reparent", "transform"))
+    '''
+    How the draggable follows the touch.
+
+    * ``"reparent"`` (default): The draggable is moved under the ``Window`` and its ``x`` and ``y`` are updated
+      as the touch moves.
+    * ``"transform"``: The draggable stays in its original parent and is moved by a
+      :class:`~kivy.graphics.Translate` instruction (:attr:`DragContext.translate`), so neither the original
+      parent nor the ``Window`` has to redo its layout during the drag. Note that the draggable is still
+      drawn as a part of its parent, which means it may be covered by its later siblings or clipped by
+      an ancestor such as :class:`~kivyx.uix.scrollview.KXScrollView`.
+    '''
+
+    drag_group = ObjectProperty(None, allownone=True)
+    '''
+    A sequence of other draggables, such as the currently selected items, that will be dragged together with
+    this one. It is read when a drag starts, and the members that are not in the widget tree or are being
+    dragged at that moment are ignored. The drop target receives a single ``on_drag_release`` event with
+    the members in :attr:`DragContext.group`.
+
+    Defaults to None.
+    '''
+
     is_being_dragged = AliasProperty(lambda self: self.drag_state is not None, bind=('drag_state', ), cache=True)
     '''(read-only)'''
 
@@ -181,6 +331,7 @@ class KXDraggableBehavior:
         '''
 
     def __init__(self, **kwargs):
+        setup_events()
         self.__main_task = ak.dummy_task
         self.__start_ev = ak.ExclusiveEvent()
         self.__cancel_ev = ak.ExclusiveEvent()
@@ -255,14 +406,20 @@ class KXDraggableBehavior:
             return t is touch
         touch_ud = touch.ud
         try:
+            transform_mode = self.drag_mode == "transform"
+            group, group_states = _detach_group(self)
             ctx = DragContext(
                 draggable=self,
-                original_state=save_widget_state(self),
+                group=group,
+                group_states=group_states,
+                original_state=None if transform_mode else save_widget_state(self),
                 original_pos=self.to_window(*self.pos),
                 start_from=receiver.to_window(*touch.opos),
+                translate=Translate() if transform_mode else None,
             )
             self_x, self_y = ctx.original_pos
             ox, oy = ctx.start_from
+            source = self.parent
             offset_x = self_x - ox
             offset_y = self_y - oy
 
@@ -271,45 +428,79 @@ class KXDraggableBehavior:
             touch_ud['kivyx_drag_ctx'] = ctx
             touch_ud["kivyx_exclusive_access"].claim()
 
-            # move self under the Window
-            if self.parent is not None:
-                self.parent.remove_widget(self)
-            self.size_hint_x = self.size_hint_y = None
-            self.pos_hint = {}
-            self.x = self_x
-            self.y = self_y
-            Window.add_widget(self)
-
-            # actual dragging process
-            self.dispatch('on_drag_start', touch, ctx)
-            self.drag_state = 'started'
-            async with (
-                ak.move_on_when(touch_ud["kivyx_end_event"].wait()),
-                ak.event_freq(Window, "on_touch_move", filter=is_same_touch) as on_touch_move,
-            ):
-                while True:
-                    await on_touch_move()
-                    self.x = touch.x + offset_x
-                    self.y = touch.y + offset_y
-
-            # wait for other widgets to respond to the 'on_touch_up' event
-            await ak.sleep(-1)
+            with (ak.transform(self, use_outer_canvas=True) if transform_mode else nullcontext()) as ig:
+                if transform_mode:
+                    ig.add(translate := ctx.translate)
+                    to_window = self.to_window
 
-            ctx.released_on = released_on = touch_ud.get('kivyx_drag_released_on', None)
-            if released_on is None or (not released_on.dispatch("on_drag_release", touch, ctx)):
-                r = self.dispatch('on_drag_fail', touch, ctx)
-                self.drag_state = 'failed'
-            else:
-                r = self.dispatch('on_drag_succeed', touch, ctx)
-                self.drag_state = 'succeeded'
-            if isawaitable(r):
-                await r
+                    def update_translate(*__):
+                        # The draggable can be moved by its parent (e.g. a reorder layout or a scrollview),
+                        # thus the translation is computed from its current position.
+                        wx, wy = to_window(*self.pos)
+                        translate.xy = (touch.x + offset_x - wx, touch.y + offset_y - wy)
+                else:
+                    # move self under the Window
+                    if self.parent is not None:
+                        self.parent.remove_widget(self)
+                    self.size_hint_x = self.size_hint_y = None
+                    self.pos_hint = {}
+                    self.x = self_x
+                    self.y = self_y
+                    Window.add_widget(self)
+
+                # actual dragging process
+                self.dispatch('on_drag_start', touch, ctx)
+                drag_registry._add(ctx, touch_ud['kivyx_drag_cls'])
+                self.drag_state = 'started'
+                with (
+                    _draw_group_as_stack(
+                        self, group, *((ig, len(ig.children)) if transform_mode else (self.canvas.before, 0)))
+                    if group else nullcontext()
+                ):
+                    async with (
+                        ak.move_on_when(touch_ud["kivyx_end_event"].wait()),
+                        ak.event_freq(Window, "on_touch_move", filter=is_same_touch) as on_touch_move,
+                    ):
+                        request_autoscroll = _autoscroll_driver.request
+                        if transform_mode:
+                            pos_uid = self.fbind("pos", update_translate)
+                            try:
+                                while True:
+                                    await on_touch_move()
+                                    update_translate()
+                                    request_autoscroll(touch, source, update_translate)
+                                    stamp("drag", touch)
+                            finally:
+                                self.unbind_uid("pos", pos_uid)
+                        else:
+                            while True:
+                                await on_touch_move()
+                                self.x = touch.x + offset_x
+                                self.y = touch.y + offset_y
+                                request_autoscroll(touch, source)
+                                stamp("drag", touch)
+
+                    # wait for other widgets to respond to the 'on_touch_up' event
+                    await ak.sleep(-1)
+
+                ctx.released_on = released_on = touch_ud.get('kivyx_drag_released_on', None)
+                if released_on is None or (not released_on.dispatch("on_drag_release", touch, ctx)):
+                    r = self.dispatch('on_drag_fail', touch, ctx)
+                    self.drag_state = 'failed'
+                else:
+                    r = self.dispatch('on_drag_succeed', touch, ctx)
+                    self.drag_state = 'succeeded'
+                if isawaitable(r):
+                    await r
         except ak.Cancelled:
             self.dispatch('on_drag_cancel', touch, ctx)
             self.drag_state = 'cancelled'
             raise
         finally:
+            _autoscroll_driver.discard(touch)
+            _restore_group(ctx)
             self.dispatch('on_drag_end', touch, ctx)
+            drag_registry._remove(ctx)
             self.drag_state = None
             touch_ud['kivyx_drag_released_on'] = None
             del touch_ud['kivyx_drag_cls']
@@ -325,17 +516,168 @@ class KXDraggableBehavior:
         pass
 
     async def on_drag_fail(self, touch, ctx: DragContext):
+        if (translate := ctx.translate) is not None:
+            await ak.anim_attrs(translate, duration=.1, x=0, y=0)
+            return
         x, y = ctx.original_pos
         await ak.anim_attrs(self, duration=.1, x=x, y=y)
         restore_widget_state(self, ctx.original_state)
 
     def on_drag_cancel(self, touch, ctx: DragContext):
-        restore_widget_state(self, ctx.original_state)
+        if ctx.original_state is not None:
+            restore_widget_state(self, ctx.original_state)
 
 
-def ongoing_drags() -> list[KXDraggableBehavior]:
-    '''Returns a list of draggables currently being dragged'''
-    return [c for c in Window.children if getattr(c, 'is_being_dragged', False)]
+class _AutoScrollDriver:
+    '''
+    Auto-scrolls :class:`~kivyx.uix.scrollview.KXScrollView` s for all the ongoing drags from a single per-frame
+    callback. Only the KXScrollViews that contain the drop targets the drag is over, or the place the draggable
+    was dragged from, are scrolled, and only the innermost one of them that can scroll towards the pointer.
+    A drag is dropped from the driver as soon as none of them is scrolled, at which point the ones it was
+    scrolling stop, and the callback stops when no drag is left.
+    '''
+    __slots__ = ("_drags", "_clock_event", "__weakref__", )
+
+    def __init__(self):
+        # touch -> [a callable to be called after scrolling or None, the drag source, the view being scrolled]
+        self._drags = {}
+        self._clock_event = None
+
+    def request(self, touch, source, on_scroll=None):
+        '''
+        :param source: The widget the draggable was dragged from. The KXScrollViews containing it can be scrolled.
+        '''
+        if (d := self._drags.get(touch)) is None:
+            self._drags[touch] = [on_scroll, source, None]
+        else:
+            d[0] = on_scroll
+        if self._clock_event is None:
+            self._clock_event = Clock.schedule_interval(self._update, 0)
+
+    def discard(self, touch):
+        drags = self._drags
+        if (d := drags.pop(touch, None)) is not None:
+            self._stop(d[2])
+        if (not drags) and (e := self._clock_event) is not None:
+            e.cancel()
+            self._clock_event = None
+
+    @staticmethod
+    def _stop(view):
+        # Otherwise the content would keep coasting after the pointer left the margin.
+        if view is not None:
+            if (e := view._effect_x) is not None:
+                e.velocity = 0
+            if (e := view._effect_y) is not None:
+                e.velocity = 0
+
+    @staticmethod
+    def _autoscroll(widget, x, y, views):
+        '''Auto-scrolls the innermost KXScrollView containing the ``widget`` that can scroll, and returns it.'''
+        while widget is not None:
+            if widget in views and widget._autoscroll(x, y):
+                return widget
+            parent = widget.parent
+            if parent is widget:  # the Window is its own parent
+                break
+            widget = parent
+        return None
+
+    def _update(self, dt):
+        drags = self._drags
+        views = set(_autoscrollable_views)
+        if not views:
+            # None of the drags can be scrolling anything, as each view being scrolled is kept alive by its drag.
+            drags.clear()
+        autoscroll = self._autoscroll
+        hovered_targets = _hover_resolver.hovered_widgets
+        for touch, d in tuple(drags.items()):
+            on_scroll, source, prev_view = d
+            x, y = touch.pos
+            for target in hovered_targets(touch):
+                if (view := autoscroll(target, x, y, views)) is not None:
+                    break
+            else:
+                view = autoscroll(source, x, y, views)
+            if view is not prev_view:
+                self._stop(prev_view)
+                d[2] = view
+            if view is None:
+                del drags[touch]
+            elif on_scroll is not None:
+                on_scroll()
+        if not drags:
+            self._clock_event = None
+            return False
+
+
+_autoscroll_driver = _AutoScrollDriver()
+
+
+class DragRegistry(EventDispatcher):
+    '''
+    Keeps track of the ongoing drags. Use the :data:`drag_registry` instead of instantiating this.
+
+    .. code-block::
+
+        def on_change(registry, ctx, added):
+            print("started" if added else "ended", ctx.draggable)
+
+        drag_registry.bind(on_change=on_change)
+    '''
+
+    __events__ = ("on_change", )
+
+    count = NumericProperty(0)
+    '''(read-only) The number of the ongoing drags.'''
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._contexts = {}  # DragContext -> drag_cls
+        self._contexts_per_cls = {}  # drag_cls -> {DragContext: None, }
+
+    def contexts(self, drag_cls=None) -> list[DragContext]:
+        '''
+        Returns a list of the :class:`DragContext` s of the ongoing drags, in the order they started.
+        If ``drag_cls`` is given, only the ones of that :attr:`KXDraggableBehavior.drag_cls` are returned.
+        '''
+        if drag_cls is None:
+            return list(self._contexts)
+        return list(self._contexts_per_cls.get(drag_cls, ()))
+
+    def _add(self, ctx: DragContext, drag_cls):
+        self._contexts[ctx] = drag_cls
+        self._contexts_per_cls.setdefault(drag_cls, {})[ctx] = None
+        self.count += 1
+        self.dispatch("on_change", ctx, True)
+
+    def _remove(self, ctx: DragContext):
+        try:
+            drag_cls = self._contexts.pop(ctx)
+        except KeyError:
+            return
+        per_cls = self._contexts_per_cls
+        d = per_cls[drag_cls]
+        del d[ctx]
+        if not d:
+            del per_cls[drag_cls]
+        self.count -= 1
+        self.dispatch("on_change", ctx, False)
+
+    def on_change(self, ctx: DragContext, added: bool):
+        '''Fired when a drag starts (``added`` is True) or ends (``added`` is False).'''
+
+
+drag_registry = DragRegistry()
+'''The :class:`DragRegistry` that every :class:`KXDraggableBehavior` reports its drags to.'''
+
+
+def ongoing_drags(drag_cls=None) -> list[KXDraggableBehavior]:
+    '''
+    Returns a list of draggables currently being dragged.
+    If ``drag_cls`` is given, only the ones of that :attr:`KXDraggableBehavior.drag_cls` are returned.
+    '''
+    return [ctx.draggable for ctx in drag_registry.contexts(drag_cls)]
 
 
 class KXDragTargetBehavior:
@@ -343,6 +685,7 @@ class KXDragTargetBehavior:
     drag_classes = ListProperty([])
 
     def __init__(self, **kwargs):
+        setup_events()
         self.__main_task = ak.dummy_task
         super().__init__(**kwargs)
         self.__ud_key = "KXDragTargetBehavior." + str(self.uid)
@@ -381,7 +724,7 @@ class KXDragTargetBehavior:
                 dispatch('on_drag_enter', touch, ctx)
                 async with (
                     ak.move_on_when(touch.ud["kivyx_end_event"].wait()),
-                    _touch_move_events(self, touch) as on_touch_move,
+                    _touch_move_events(self, touch, every_move=False) as on_touch_move,
                 ):
                     while True:
                         if inside is await on_touch_move():
@@ -400,13 +743,10 @@ class KXDragTargetBehavior:
     on_drag_leave = on_drag_enter
 
     def on_drag_release(self, touch, ctx: DragContext) -> bool:
-        d = ctx.draggable
-        d.parent.remove_widget(d)
-        os = ctx.original_state
-        d.size_hint_x = os['size_hint_x']
-        d.size_hint_y = os['size_hint_y']
-        d.pos_hint = os['pos_hint']
-        self.add_widget(d)
+        _detach_draggable(ctx)
+        add_widget = self.add_widget
+        for d in ctx.draggables:
+            add_widget(d)
         return True
 
 
@@ -420,8 +760,20 @@ class KXDragReorderBehavior:
     :class:`KXDragReorderBehavior`` can handle.
     '''
 
+    reorder_anim_duration = NumericProperty(0)
+    '''
+    The duration (in seconds) of the animation that slides the children displaced by a spacer to their new
+    positions. The animations are applied through :class:`~kivy.graphics.Translate` instructions, and when
+    a spacer moves again before they end, they restart from where the children are currently drawn.
+    Setting this to 0 disables the animations.
+
+    Defaults to 0.
+    '''
+
     def __init__(self, **kwargs):
+        setup_events()
         self.__main_task = ak.dummy_task
+        self.__displaced = None
         super().__init__(**kwargs)
         self.__ud_key = "KXDragReorderBehavior." + str(self.uid)
         t = Clock.schedule_once(self.__reset, -1)
@@ -482,16 +834,27 @@ class KXDragReorderBehavior:
             del ud[self.__ud_key]
 
     async def __place_a_spacer_under_drag(self, touch, spacer_initial_index=0):
-        spacer = self.__inactive_spacers.pop()
         touch_ud = touch.ud
         get_child_under_drag = self.get_child_under_drag
         remove_widget = self.remove_widget
         add_widget = self.add_widget
-        to_local = self.to_local
+        to_widget = self.to_widget
         ctx = touch_ud['kivyx_drag_ctx']
+        draggable = ctx.draggable
+        # A draggable being dragged in the "transform" mode stays in its original parent, and its slot looks empty.
+        # So if that parent is this layout, the draggable itself serves as the spacer.
+        uses_draggable_as_spacer = ctx.translate is not None and draggable.parent is self
+        spacer = draggable if uses_draggable_as_spacer else self.__inactive_spacers.pop()
         try:
-            restore_widget_state(spacer, ctx.original_state, ignore_parent=True)
-            add_widget(spacer, index=spacer_initial_index)
+            if not uses_draggable_as_spacer:
+                restore_widget_state(
+                    spacer,
+                    save_widget_state(draggable, ignore_parent=True) if ctx.original_state is None
+                    else ctx.original_state,
+                    ignore_parent=True,
+                )
+                self.__mark_as_displaced(self.children)
+                add_widget(spacer, index=spacer_initial_index)
             async with ak.move_on_when(ak.event(ctx.draggable, "on_drag_cancel")):
                 async with (
                     ak.move_on_when(touch_ud["kivyx_end_event"].wait()),
@@ -500,7 +863,7 @@ class KXDragReorderBehavior:
                     while True:
                         if not await on_touch_move():
                             return
-                        child, idx = get_child_under_drag(*to_local(*touch.pos))
+                        child, idx = get_child_under_drag(*to_widget(*touch.pos))
                         if child is spacer:
                             continue
                         if child is None:
@@ -508,6 +871,10 @@ class KXDragReorderBehavior:
                                 continue
                             else:
                                 idx = 0
+                        if self.reorder_anim_duration:
+                            children = self.children
+                            i = children.index(spacer)
+                            self.__mark_as_displaced(children[min(i, idx):max(i, idx) + 1])
                         remove_widget(spacer)
                         add_widget(spacer, index=idx)
                 if 'kivyx_drag_released_on' not in touch_ud:
@@ -515,17 +882,45 @@ class KXDragReorderBehavior:
                     touch_ud['kivyx_draggable_index'] = self.children.index(spacer)
         finally:
             del touch_ud[self.__ud_key]
-            self.remove_widget(spacer)
-            self.__inactive_spacers.append(spacer)
+            if not uses_draggable_as_spacer:
+                self.__mark_as_displaced(self.children)
+                self.remove_widget(spacer)
+                self.__inactive_spacers.append(spacer)
+
+    def __mark_as_displaced(self, children):
+        '''Lets the next layout pass animate the given children if they move.'''
+        if not self.reorder_anim_duration:
+            return
+        if (d := self.__displaced) is None:
+            self.__displaced = set(children)
+        else:
+            d.update(children)
+
+    def do_layout(self, *args):
+        displaced = self.__displaced
+        animator = _reorder_animator
+        if displaced is None and not animator.is_active:
+            return super().do_layout(*args)
+        self.__displaced = None
+        is_animating = animator.is_animating
+        # A draggable being dragged in the "transform" mode is left to the drag.
+        targets = [
+            c for c in self.children
+            if (is_animating(c) or (displaced is not None and c in displaced))
+            and not getattr(c, 'is_being_dragged', False)
+        ]
+        visual_pos = animator.visual_pos
+        old_positions = [visual_pos(c) for c in targets]
+        super().do_layout(*args)
+        animator.animate(targets, old_positions, self.reorder_anim_duration)
 
     def on_drag_release(self, touch, ctx: DragContext) -> bool:
-        d = ctx.draggable
-        d.parent.remove_widget(d)
-        os = ctx.original_state
-        d.size_hint_x = os['size_hint_x']
-        d.size_hint_y = os['size_hint_y']
-        d.pos_hint = os['pos_hint']
-        self.add_widget(d, index=touch.ud["kivyx_draggable_index"])
+        _detach_draggable(ctx)
+        add_widget = self.add_widget
+        index = touch.ud["kivyx_draggable_index"]
+        # Inserting each one at the same index lines the group members up after the draggable.
+        for d in ctx.draggables:
+            add_widget(d, index=index)
         return True
 
     def get_child_under_drag(self, x, y) -> tuple[Widget, int]:
@@ -539,12 +934,266 @@ class KXDragReorderBehavior:
         return (None, None)
 
 
+class KXRecycleDragReorderBehavior:
+    '''
+    A :class:`KXDragReorderBehavior` counterpart for :class:`~kivy.uix.recycleboxlayout.RecycleBoxLayout`.
+    Instead of moving widgets around, it moves items in ``recycleview.data``, which lets you reorder lists that
+    are too long to have a widget for every item.
+
+    .. code-block::
+
+        class ReorderableRecycleBoxLayout(KXRecycleDragReorderBehavior, RecycleBoxLayout):
+            pass
+
+    Notes:
+
+    * Only the drags that start from one of its views are handled, and the views must be
+      :class:`KXDraggableBehavior` whose :attr:`KXDraggableBehavior.drag_mode` is ``"transform"`` because they
+      are owned by the :class:`~kivy.uix.recycleview.RecycleView`.
+    * Instead of a spacer, a line is drawn where the item is going to be inserted.
+    '''
+
+    __events__ = ("on_drag_release", "on_data_reorder", )
+    drag_classes = ListProperty([])
+
+    drop_indicator_color = ColorProperty("#44AAFF")
+    '''The color of the line that indicates where the item is going to be inserted.'''
+
+    drop_indicator_width = NumericProperty("2dp")
+    '''The width of the line that indicates where the item is going to be inserted.'''
+
+    def __init__(self, **kwargs):
+        setup_events()
+        self.__main_task = ak.dummy_task
+        super().__init__(**kwargs)
+        self.__ud_key = "KXRecycleDragReorderBehavior." + str(self.uid)
+        t = Clock.schedule_once(self.__reset, -1)
+        f = self.fbind
+        f("disabled", t)
+        f("drag_classes", t)
+
+    # Python's name mangling is weird. This method cannot be named '__reset'.
+    def _KXRecycleDragReorderBehavior__reset(self, __):
+        self.__main_task.cancel()
+        if self.disabled:
+            return
+        self.__main_task = ak.managed_start(self.__listen_to_touch_down_events())
+
+    async def __listen_to_touch_down_events(self):
+        handler = self.__handle_a_potential_dragging_gesture
+        on_touch_down = partial(ak.event, self, "on_touch_down", filter=is_opos_colliding_and_not_wheel)
+        async with ak.open_nursery() as nursery:
+            while True:
+                __, touch = await on_touch_down()
+                nursery.start(handler(touch))
+
+    async def __handle_a_potential_dragging_gesture(self, touch):
+        ud = touch.ud
+        await ud["kivyx_exclusive_access"].wait_for_someone_to_claim()
+        if ud.get("kivyx_drag_cls", None) not in self.drag_classes:
+            return
+        ctx = ud['kivyx_drag_ctx']
+        from_index = self.view_indices.get(ctx.draggable.__self__)
+        if from_index is None:
+            return
+        ud[self.__ud_key] = (from_index, from_index)
+        try:
+            await self.__draw_drop_indicator_under_drag(touch, ctx, from_index)
+        finally:
+            if ud.get('kivyx_drag_released_on', None) is not self:
+                del ud[self.__ud_key]
+
+    async def __draw_drop_indicator_under_drag(self, touch, ctx: DragContext, from_index):
+        touch_ud = touch.ud
+        ud_key = self.__ud_key
+        get_slot_at = self.get_slot_at
+        to_widget = self.to_widget
+        with self.canvas.after:
+            color = Color(*self.drop_indicator_color)
+            rect = Rectangle(size=(0, 0))
+        try:
+            async with ak.move_on_when(ak.event(ctx.draggable, "on_drag_cancel")):
+                inside = False
+                async with (
+                    ak.move_on_when(touch_ud["kivyx_end_event"].wait()),
+                    _touch_move_events(self, touch) as on_touch_move,
+                ):
+                    slot = None
+                    while True:
+                        inside = await on_touch_move()
+                        if not inside:
+                            slot = None
+                            rect.size = (0, 0)
+                            continue
+                        new_slot = get_slot_at(*to_widget(*touch.pos))
+                        if new_slot == slot:
+                            continue
+                        slot = new_slot
+                        rect.pos, rect.size = self._get_drop_indicator_rect(slot)
+                if inside and slot is not None and 'kivyx_drag_released_on' not in touch_ud:
+                    touch_ud['kivyx_drag_released_on'] = self
+                    touch_ud[ud_key] = (from_index, slot if slot <= from_index else slot - 1)
+        finally:
+            canvas = self.canvas.after
+            canvas.remove(color)
+            canvas.remove(rect)
+
+    def get_slot_at(self, x, y) -> int:
+        '''
+        Returns the index in the data where an item dropped at the given position (in the local coordinates)
+        would be inserted, or ``len(data)`` if it would be appended. Unlike the
+        ``RecycleBoxLayout.get_view_index_at()``, this runs in O(log n) time.
+        '''
+        opts = self.view_opts
+        if self.orientation == 'horizontal':
+            return bisect_left(opts, x, key=lambda o: o['pos'][0] + o['size'][0] / 2.)
+        return bisect_left(opts, -y, key=lambda o: -(o['pos'][1] + o['size'][1] / 2.))
+
+    def _get_drop_indicator_rect(self, slot) -> tuple[tuple, tuple]:
+        opts = self.view_opts
+        w = self.drop_indicator_width
+        if self.orientation == 'horizontal':
+            if slot < len(opts):
+                x = opts[slot]['pos'][0]
+            else:
+                o = opts[-1]
+                x = o['pos'][0] + o['size'][0]
+            return (x - w / 2., self.y), (w, self.height)
+        if slot < len(opts):
+            o = opts[slot]
+            y = o['pos'][1] + o['size'][1]
+        else:
+            y = opts[-1]['pos'][1]
+        return (self.x, y - w / 2.), (self.width, w)
+
+    def on_drag_release(self, touch, ctx: DragContext) -> bool:
+        from_index, to_index = touch.ud.pop(self.__ud_key)
+        self.dispatch("on_data_reorder", from_index, to_index)
+        return True
+
+    def on_data_reorder(self, from_index, to_index):
+        '''
+        Moves the item at ``from_index`` to ``to_index``. The default handler does it with a single slice
+        assignment, so the :class:`~kivy.uix.recycleview.RecycleView` refreshes only the affected range.
+        '''
+        if from_index == to_index:
+            return
+        data = self.recycleview.data
+        if from_index < to_index:
+            data[from_index:to_index + 1] = data[from_index + 1:to_index + 1] + [data[from_index]]
+        else:
+            data[to_index:from_index + 1] = [data[from_index]] + data[to_index:from_index]
+
+
+class _HoverWatcher:
+    __slots__ = ("widget", "touch", "task_step", "every_move", "inside", "hit", "uid", )
+
+
+class _HoverResolver:
+    '''
+    Works out which of the watched widgets each drag is over, once per frame for all of them.
+
+    A watched widget only records whether a touch reached it through its ``on_touch_move`` (which is how
+    the parts hidden by a ScrollView or the like are excluded), and a single trigger compares that with the
+    previous frame and resumes the watchers whose state changed. When a touch is released, the pending
+    moves of it are resolved right away so that the final position is never missed. The Window listeners
+    and the trigger exist only while something is being watched.
+    '''
+    __slots__ = ("_watchers", "_moved", "_trigger", "_window_uids", "__weakref__", )
+
+    def __init__(self):
+        self._watchers = {}  # touch -> [_HoverWatcher, ]
+        self._moved = set()  # touches that moved in the current frame
+        self._trigger = None
+        self._window_uids = None
+
+    def watch(self, widget, touch, task_step, every_move) -> _HoverWatcher:
+        if self._window_uids is None:
+            self._trigger = Clock.create_trigger(self._resolve_all, -1)
+            f = Window.fbind
+            self._window_uids = (f("on_touch_move", self._on_window_touch_move),
+                                 f("on_touch_up", self._on_window_touch_up))
+        w = _HoverWatcher()
+        w.widget = widget
+        w.touch = touch
+        w.task_step = task_step
+        w.every_move = every_move
+        w.inside = True  # every watcher is started by a touch inside the widget
+        w.hit = False
+        w.uid = widget.fbind("on_touch_move", partial(self._on_widget_touch_move, w, widget.collide_point))
+        self._watchers.setdefault(touch, []).append(w)
+        return w
+
+    def unwatch(self, w: _HoverWatcher):
+        w.widget.unbind_uid("on_touch_move", w.uid)
+        w.task_step = None
+        watchers = self._watchers
+        touch = w.touch
+        ws = watchers[touch]
+        ws.remove(w)
+        if ws:
+            return
+        del watchers[touch]
+        self._moved.discard(touch)
+        if watchers:
+            return
+        self._trigger.cancel()
+        self._trigger = None
+        move_uid, up_uid = self._window_uids
+        self._window_uids = None
+        Window.unbind_uid("on_touch_move", move_uid)
+        Window.unbind_uid("on_touch_up", up_uid)
+
+    @staticmethod
+    def _on_widget_touch_move(w, collide_point, widget, t):
+        if t is w.touch and collide_point(*t.pos):
+            w.hit = True
+
+    def hovered_widgets(self, touch) -> list:
+        '''Returns the watched widgets the ``touch`` was over when it was last resolved.'''
+        return [w.widget for w in self._watchers.get(touch, ()) if w.inside]
+
+    def _on_window_touch_move(self, window, touch):
+        if touch in self._watchers:
+            self._moved.add(touch)
+            self._trigger()
+
+    def _on_window_touch_up(self, window, touch):
+        moved = self._moved
+        if touch in moved:
+            moved.remove(touch)
+            self._resolve(touch)
+
+    def _resolve_all(self, dt):
+        moved = self._moved
+        while moved:
+            self._resolve(moved.pop())
+
+    def _resolve(self, touch):
+        for w in tuple(self._watchers.get(touch, ())):
+            if w.task_step is None:  # unwatched while resolving
+                continue
+            inside = w.hit
+            w.hit = False
+            if inside is not w.inside or (inside and w.every_move):
+                w.inside = inside
+                w.task_step(inside)
+
+
+_hover_resolver = _HoverResolver()
+
+
 class _touch_move_events:
     '''
     DragTargetが一部しか見えていない状況(例えばScrollView内に置かれているとか)を考えると、
     通常のタッチイベントも受け取って 見えている範囲でドラッグ操作が行われているかを判別しないといけない為、
     独自のタッチ処理が要る。
 
+    Resolved by :class:`_HoverResolver` at most once per frame. ``on_touch_move()`` returns whether the touch is
+    over the widget. If ``every_move`` is False, it only returns when that changes. Otherwise it also returns
+    for every frame in which the touch moved over the widget. As the value is resolved after the touch event,
+    ``touch.pos`` is in window coordinates by then.
+
     .. code-block::
 
         async with(
@@ -556,33 +1205,16 @@ class _touch_move_events:
                 ...
     '''
 
-    def __init__(self, widget, touch):
+    def __init__(self, widget, touch, *, every_move=True):
         self.widget = widget
         self.touch = touch
-
-    @staticmethod
-    def _on_touch_move(task_step, collide_point, cancel_resumption, touch, w, t) -> bool:
-        if touch is t and collide_point(*t.pos):
-            cancel_resumption()
-            task_step(True)
-
-    @staticmethod
-    def _on_touch_move_win(trigger_resumption, touch, w, t) -> bool:
-        if touch is t:
-            trigger_resumption()
+        self.every_move = every_move
 
     @types.coroutine
-    def __aenter__(self, partial=partial):
-        widget = self.widget
-        touch = self.touch
+    def __aenter__(self):
         task = (yield _current_task)[0][0]
-        self.trigger_resumption = t = Clock.create_trigger(partial(task._step, False), -1)
-        self._uid_win = Window.fbind("on_touch_move", partial(self._on_touch_move_win, t, touch))
-        self._uid = widget.fbind("on_touch_move",
-                                 partial(self._on_touch_move, task._step, widget.collide_point, t.cancel, touch))
+        self._watcher = _hover_resolver.watch(self.widget, self.touch, task._step, self.every_move)
         return _wait_args_0
 
     async def __aexit__(self, *__):
-        Window.unbind_uid("on_touch_move", self._uid_win)
-        self.widget.unbind_uid("on_touch_move", self._uid)
-        self.trigger_resumption.cancel()
+        _hover_resolver.unwatch(self._watcher)
@@ -10,20 +10,31 @@ The swipe2delete module provides two ways to add swipe-to-delete functionality t
 * :func:`enable_swipe2delete` is an async function that enables the functionality for a specific
   instance rather than to an entire class.
 
+and :class:`KXRecycleSwipe2DeleteBehavior` for :class:`~kivy.uix.recycleboxlayout.RecycleBoxLayout`, which
+deletes items from ``recycleview.data`` instead of widgets. :class:`KXSwipeActionsBehavior` reveals actions
+behind the swiped child.
+
 `YouTube Demo <https://youtu.be/4AHhps6GPbU>`__
 '''
-__all__ = ("enable_swipe2delete", "KXSwipe2DeleteBehavior", )
+__all__ = (
+    "enable_swipe2delete", "KXSwipe2DeleteBehavior", "KXRecycleSwipe2DeleteBehavior", "KXSwipeActionsBehavior",
+)
 from typing import Literal
 from functools import partial
+from bisect import bisect_left, bisect_right
+from operator import attrgetter
 
 from kivy.metrics import dp
-from kivy.properties import NumericProperty, BooleanProperty, OptionProperty
+from kivy.properties import NumericProperty, BooleanProperty, OptionProperty, ObjectProperty
 from kivy.clock import Clock
 from kivy.core.window import Window
 from kivy.graphics import Translate
+from kivy.uix.boxlayout import BoxLayout
 import asynckivy as ak
 
+from kivyx import setup_events
 from kivyx.touch_filters import is_opos_colliding
+from kivyx.uix.behaviors._reorderanimator import _reorder_animator
 
 default_swipe_threshold = dp(20)
 default_delete_threshold = dp(300)
@@ -54,67 +65,119 @@ async def enable_swipe2delete(
 
     The effect of this function persists until the returned coroutine is cancelled.
     '''
-    abs = __builtins__["abs"]
+    setup_events()
     target = target_layout.__self__
     on_touch_down = partial(ak.event, target, "on_touch_down", filter=is_opos_colliding)
     while True:
         __, touch = await on_touch_down()
-        ox, oy = target.to_local(*touch.opos)
-        for c in target.children:
-            if c.collide_point(ox, oy):
-                break
-        else:
+        if (c := _find_child_at(target, *target.to_local(*touch.opos))) is None:
             continue
+        await _handle_swipe(
+            target, c, touch, partial(delete_action, target, c), swipe_threshold, delete_threshold, direction)
 
-        def is_the_same_touch(w, t, touch=touch):
-            return t is touch
-        ox, oy = target.to_window(*touch.opos)
-        e_access = touch.ud["kivyx_exclusive_access"]
 
-        async with (
-            ak.move_on_when(touch.ud["kivyx_end_event"].wait()),
-            ak.event_freq(Window, "on_touch_move", filter=is_the_same_touch) as on_touch_move,
-        ):
-            # Waits until the touch travels beyond the swipe threshold.
-            async with ak.move_on_when(e_access.wait_for_someone_to_claim()):
+def _find_child_at(layout, x, y):
+    '''
+    Returns the child of the ``layout`` at the given position, or None if there is none. If the ``layout`` is a
+    :class:`~kivy.uix.boxlayout.BoxLayout`, whose children are stacked in order, it takes O(log n) time.
+    '''
+    children = layout.children
+    if isinstance(layout, BoxLayout):
+        # 'children' is in the reverse order of how they are laid out.
+        if layout.orientation == 'vertical':
+            i = bisect_right(children, y, key=_get_y) - 1
+        else:
+            i = bisect_left(children, -x, key=_get_negative_right) - 1
+        if 0 <= i < len(children) and (c := children[i]).collide_point(x, y):
+            return c
+        return None
+    for c in children:
+        if c.collide_point(x, y):
+            return c
+    return None
+
+
+_get_y = attrgetter("y")
+
+
+def _get_negative_right(w):
+    return -w.right
+
+
+async def _begin_swipe(touch, on_touch_move, swipe_threshold, direction, abs=abs) -> bool:
+    '''
+    Waits until the touch travels beyond the swipe threshold, and claims exclusive access to it. Returns False if
+    someone else claimed it first.
+    '''
+    e_access = touch.ud["kivyx_exclusive_access"]
+    async with ak.move_on_when(e_access.wait_for_someone_to_claim()):
+        if direction == "horizontal":
+            while True:
+                await on_touch_move()
+                if abs(touch.x - touch.ox) > swipe_threshold:
+                    break
+        elif direction == "vertical":
+            while True:
+                await on_touch_move()
+                if abs(touch.y - touch.oy) > swipe_threshold:
+                    break
+        else:
+            raise ValueError(f"Invalid direction: {direction!r}")
+
+    if e_access.has_been_claimed:
+        return False
+    e_access.claim()
+    return True
+
+
+async def _handle_swipe(target, c, touch, on_delete, swipe_threshold, delete_threshold, direction, abs=abs):
+    '''Lets the user swipe the child ``c`` of the ``target`` and calls ``on_delete()`` if it is swiped far enough.'''
+    def is_the_same_touch(w, t, touch=touch):
+        return t is touch
+
+    # The touch is in the window coordinates during the Window's 'on_touch_move', and so are its 'ox' and 'oy',
+    # which saves converting the coordinates.
+    async with (
+        ak.move_on_when(touch.ud["kivyx_end_event"].wait()),
+        ak.event_freq(Window, "on_touch_move", filter=is_the_same_touch) as on_touch_move,
+    ):
+        if not await _begin_swipe(touch, on_touch_move, swipe_threshold, direction):
+            return
+
+        # Moves and fades the child during swipe. Both are applied at most once per frame, however frequently the
+        # touch moves, and the fading is done through the opacity of its canvas instead of the 'opacity' property,
+        # which would dispatch an event.
+        canvas = c.canvas
+        orig_opacity = c.opacity
+        fade_threshold = delete_threshold * 1.4
+        diff = 0.
+
+        def apply_diff(dt):
+            if direction == "horizontal":
+                translate.x = diff
+            else:
+                translate.y = diff
+            canvas.opacity = (1.0 - abs(diff) / fade_threshold) * orig_opacity
+
+        trigger = Clock.create_trigger(apply_diff, -1)
+        try:
+            with ak.transform(c, use_outer_canvas=True) as ig:
+                ig.add(translate := Translate())
                 if direction == "horizontal":
                     while True:
                         await on_touch_move()
-                        if abs(touch.x - ox) > swipe_threshold:
-                            break
-                elif direction == "vertical":
+                        diff = touch.x - touch.ox
+                        trigger()
+                else:
                     while True:
                         await on_touch_move()
-                        if abs(touch.y - oy) > swipe_threshold:
-                            break
-                else:
-                    raise ValueError(f"Invalid direction: {direction!r}")
-
-            if e_access.has_been_claimed:
-                continue
-            e_access.claim()
-
-            # Moves and changes the opacity of the child during swipe.
-            orig_opacity = c.opacity
-            diff = 0.
-            try:
-                with ak.transform(c, use_outer_canvas=True) as ig:
-                    ig.add(translate := Translate())
-                    fade_threshold = delete_threshold * 1.4
-                    if direction == "horizontal":
-                        while True:
-                            await on_touch_move()
-                            translate.x = diff = touch.x - ox
-                            c.opacity = (1.0 - abs(diff) / fade_threshold) * orig_opacity
-                    else:
-                        while True:
-                            await on_touch_move()
-                            translate.y = diff = touch.y - oy
-                            c.opacity = (1.0 - abs(diff) / fade_threshold) * orig_opacity
-            finally:
-                c.opacity = orig_opacity
-                if abs(diff) > delete_threshold:
-                    delete_action(target, c)
+                        diff = touch.y - touch.oy
+                        trigger()
+        finally:
+            trigger.cancel()
+            canvas.opacity = c.opacity
+            if abs(diff) > delete_threshold:
+                on_delete()
 
 
 class KXSwipe2DeleteBehavior:
@@ -139,6 +202,7 @@ class KXSwipe2DeleteBehavior:
         layout.remove_widget(child)
 
     def __init__(self, **kwargs):
+        setup_events()
         self.__main_task = ak.dummy_task
         self.register_event_type("on_swipe2delete")
         super().__init__(**kwargs)
@@ -163,3 +227,326 @@ class KXSwipe2DeleteBehavior:
             direction=self.s2d_direction,
             delete_action=partial(self.dispatch, "on_swipe2delete"),
         ))
+
+
+class KXRecycleSwipe2DeleteBehavior:
+    '''
+    A :class:`KXSwipe2DeleteBehavior` counterpart for :class:`~kivy.uix.recycleboxlayout.RecycleBoxLayout`.
+    Instead of removing widgets, it dispatches an ``on_data_delete`` event with the indices of the swiped items,
+    whose default handler removes them from ``recycleview.data``.
+
+    .. code-block::
+
+        class SwipeableRecycleBoxLayout(KXRecycleSwipe2DeleteBehavior, RecycleBoxLayout):
+            pass
+
+    Multiple items can be swiped at the same time. The ones swiped away within the same frame are deleted together,
+    with a single mutation of the data, and the remaining views slide into the gap.
+    '''
+
+    __events__ = ("on_data_delete", )
+
+    s2d_disabled = BooleanProperty(False)
+    '''If either of ``disabled`` or :attr:`s2d_disabled` is ``True``,
+    the swipe-to-delete functionality is disabled. '''
+
+    s2d_swipe_threshold = NumericProperty(default_swipe_threshold)
+    '''The minimum distance a touch must travel to be recognized as a swipe gesture. '''
+
+    s2d_delete_threshold = NumericProperty(default_delete_threshold)
+    '''The minimum distance a swipe gesture must travel to delete the item upon release. '''
+
+    s2d_direction = OptionProperty("horizontal", options=("horizontal", "vertical", ))
+
+    s2d_collapse_duration = NumericProperty(.2)
+    '''The duration of the animation that closes the gap left by deleted items. 0 disables it.'''
+
+    def __init__(self, **kwargs):
+        setup_events()
+        self.__main_task = ak.dummy_task
+        self.__pending_indices = set()
+        self.__trigger_flush = Clock.create_trigger(self.__flush, -1)
+        super().__init__(**kwargs)
+        t = Clock.schedule_once(self.__reset)
+        f = self.fbind
+        f("disabled", t)
+        f("parent", t)
+        f("s2d_disabled", t)
+        f("s2d_swipe_threshold", t)
+        f("s2d_delete_threshold", t)
+        f("s2d_direction", t)
+
+    # Python's name mangling is weird. This method cannot be named '__reset'.
+    def _KXRecycleSwipe2DeleteBehavior__reset(self, __):
+        self.__main_task.cancel()
+        if (self.parent is None) or self.disabled or self.s2d_disabled:
+            return
+        self.__main_task = ak.managed_start(self.__main(
+            self.s2d_swipe_threshold, self.s2d_delete_threshold, self.s2d_direction))
+
+    async def __main(self, swipe_threshold, delete_threshold, direction):
+        on_touch_down = partial(ak.event, self, "on_touch_down", filter=is_opos_colliding)
+        get_visible_view = self.recycleview.view_adapter.get_visible_view
+        delete_later = self.__delete_later
+        async with ak.open_nursery() as nursery:
+            while True:
+                __, touch = await on_touch_down()
+                index = self.get_index_at(*self.to_local(*touch.opos))
+                if index is None or (view := get_visible_view(index)) is None:
+                    continue
+                nursery.start(_handle_swipe(
+                    self, view, touch, partial(delete_later, view), swipe_threshold, delete_threshold, direction))
+
+    def get_index_at(self, x, y) -> int | None:
+        '''
+        Returns the index in the data of the item at the given position (in the local coordinates), or None if there
+        is none. Unlike the ``RecycleBoxLayout.get_view_index_at()``, this runs in O(log n) time.
+        '''
+        opts = self.view_opts
+        if self.orientation == 'horizontal':
+            i = bisect_right(opts, x, key=lambda o: o['pos'][0] + o['size'][0])
+            if i < len(opts) and opts[i]['pos'][0] <= x:
+                return i
+        else:
+            i = bisect_left(opts, -y, key=lambda o: -o['pos'][1])
+            if i < len(opts) and y < opts[i]['pos'][1] + opts[i]['size'][1]:
+                return i
+        return None
+
+    def __delete_later(self, view):
+        # The index is looked up at this point because the data may have changed during the swipe.
+        if (index := self.view_indices.get(view)) is None:
+            return
+        self.__pending_indices.add(index)
+        self.__trigger_flush()
+
+    # Python's name mangling is weird. The methods passed to the Clock cannot be named '__xxx'.
+    def _KXRecycleSwipe2DeleteBehavior__flush(self, dt):
+        indices = sorted(self.__pending_indices)
+        self.__pending_indices.clear()
+        if not indices:
+            return
+        opts = self.view_opts
+        size_index = 0 if self.orientation == 'horizontal' else 1
+        spacing = self.spacing
+        # (the index in the new data from which the following items are shifted, the extent of the deleted item)
+        gaps = [(i - n, opts[i]['size'][size_index] + spacing) for n, i in enumerate(indices)]
+        self.dispatch("on_data_delete", indices)
+        if self.s2d_collapse_duration:
+            # The data change made the RecycleView schedule its refresh as a -1 event. This one is scheduled after
+            # it, so both run in this frame, and the views are already laid out for the new data when this runs.
+            Clock.schedule_once(partial(self.__collapse, gaps), -1)
+
+    def _KXRecycleSwipe2DeleteBehavior__collapse(self, gaps, dt):
+        widgets = []
+        positions = []
+        horizontal = self.orientation == 'horizontal'
+        for view, index in self.view_indices.items():
+            offset = sum(extent for start, extent in gaps if start <= index)
+            if not offset:
+                continue
+            widgets.append(view)
+            positions.append((view.x + offset, view.y) if horizontal else (view.x, view.y - offset))
+        _reorder_animator.animate(widgets, positions, self.s2d_collapse_duration)
+
+    def on_data_delete(self, indices):
+        '''
+        Removes the items at the ``indices`` (sorted in ascending order) from ``recycleview.data`` with a single
+        mutation.
+        '''
+        data = self.recycleview.data
+        if len(indices) == 1:
+            del data[indices[0]]
+            return
+        first = indices[0]
+        last = len(data)  # RecycleView cannot handle a slice without the stop
+        indices = set(indices)
+        data[first:last] = [item for i, item in enumerate(data[first:last], first) if i not in indices]
+
+
+class _ActionPanelPool:
+    '''Keeps the action panels that are not in use, for each factory.'''
+    __slots__ = ("_panels", )
+
+    max_pooled = 4
+    '''The maximum number of the unused panels kept for each factory.'''
+
+    def __init__(self):
+        self._panels = {}  # factory -> [panel, ]
+
+    def acquire(self, factory):
+        if panels := self._panels.get(factory):
+            return panels.pop()
+        return factory()
+
+    def release(self, factory, panel):
+        panels = self._panels.setdefault(factory, [])
+        if len(panels) < self.max_pooled:
+            panels.append(panel)
+
+
+_action_panel_pool = _ActionPanelPool()
+
+
+class KXSwipeActionsBehavior:
+    '''
+    A mix-in class that adds leave-behind actions to layouts. Swiping a child reveals an action panel behind it,
+    and if the child is swiped by :attr:`s2d_actions_size` or more, it stays open until either the next touch
+    outside the panel or :meth:`s2d_close_actions` is called. Swiping beyond :attr:`s2d_delete_threshold` deletes
+    the child as :class:`KXSwipe2DeleteBehavior` does.
+
+    .. code-block::
+
+        class SwipeableBoxLayout(KXSwipeActionsBehavior, BoxLayout):
+            def on_s2d_actions_open(self, child, panel):
+                panel.target = child
+
+        layout = SwipeableBoxLayout(s2d_actions_factory=Factory.ArchiveAndFlagButtons)
+
+    The panels are created by :attr:`s2d_actions_factory` only when a swipe actually begins, and are returned to
+    a pool shared by all the layouts using the same factory when the swipe ends. So, set up a panel for its child
+    in ``on_s2d_actions_open`` rather than when creating it.
+    The panel is added to the :class:`~kivy.core.window.Window` while it is shown, and is resized to cover only
+    the revealed area.
+    '''
+
+    __events__ = ("on_swipe2delete", "on_s2d_actions_open", "on_s2d_actions_close", )
+
+    s2d_disabled = BooleanProperty(False)
+    '''If either of ``disabled`` or :attr:`s2d_disabled` is ``True``,
+    the functionality is disabled. '''
+
+    s2d_swipe_threshold = NumericProperty(default_swipe_threshold)
+    '''The minimum distance a touch must travel to be recognized as a swipe gesture. '''
+
+    s2d_delete_threshold = NumericProperty(default_delete_threshold)
+    '''The minimum distance a swipe gesture must travel to trigger an ``on_swipe2delete`` event upon release. '''
+
+    s2d_direction = OptionProperty("horizontal", options=("horizontal", "vertical", ))
+
+    s2d_actions_factory = ObjectProperty(None, allownone=True)
+    '''A callable that creates an action panel, such as a widget class. If None, no panel is shown.'''
+
+    s2d_actions_size = NumericProperty("160dp")
+    '''How far a child stays swiped while its actions are open.'''
+
+    def __init__(self, **kwargs):
+        setup_events()
+        self.__main_task = ak.dummy_task
+        self.__close_event = None
+        super().__init__(**kwargs)
+        t = Clock.schedule_once(self.__reset)
+        f = self.fbind
+        f("disabled", t)
+        f("parent", t)
+        f("s2d_disabled", t)
+        f("s2d_swipe_threshold", t)
+        f("s2d_delete_threshold", t)
+        f("s2d_direction", t)
+        f("s2d_actions_factory", t)
+        f("s2d_actions_size", t)
+
+    def on_swipe2delete(self, layout, child):
+        layout.remove_widget(child)
+
+    def on_s2d_actions_open(self, child, panel):
+        '''Called when the ``panel`` is about to be revealed behind the ``child``.'''
+
+    def on_s2d_actions_close(self, child, panel):
+        '''Called when the ``panel`` has been hidden, right before it returns to the pool.'''
+
+    def s2d_close_actions(self):
+        '''Closes the actions that are currently open, if any.'''
+        if (e := self.__close_event) is not None:
+            e.fire()
+
+    # Python's name mangling is weird. This method cannot be named '__reset'.
+    def _KXSwipeActionsBehavior__reset(self, __):
+        self.__main_task.cancel()
+        if (self.parent is None) or self.disabled or self.s2d_disabled:
+            return
+        self.__main_task = ak.managed_start(self.__main())
+
+    async def __main(self):
+        on_touch_down = partial(ak.event, self, "on_touch_down", filter=is_opos_colliding)
+        while True:
+            __, touch = await on_touch_down()
+            if (c := _find_child_at(self, *self.to_local(*touch.opos))) is None:
+                continue
+            await self.__handle_swipe(c, touch)
+
+    async def __handle_swipe(self, c, touch, abs=abs):
+        def is_the_same_touch(w, t, touch=touch):
+            return t is touch
+
+        async with (
+            ak.move_on_when(touch.ud["kivyx_end_event"].wait()),
+            ak.event_freq(Window, "on_touch_move", filter=is_the_same_touch) as on_touch_move,
+        ):
+            if not await _begin_swipe(touch, on_touch_move, self.s2d_swipe_threshold, self.s2d_direction):
+                return
+        if touch.ud["kivyx_end_event"].is_fired:
+            return
+
+        horizontal = self.s2d_direction == "horizontal"
+        factory = self.s2d_actions_factory
+        panel = None if factory is None else _action_panel_pool.acquire(factory)
+        # the area the child occupies in the window coordinates
+        cx, cy = c.to_window(*c.pos)
+        cw, ch = c.size
+        diff = 0.
+
+        def apply_diff(dt):
+            if horizontal:
+                translate.x = diff
+                if panel is not None:
+                    panel.pos = (cx + cw + diff, cy) if diff < 0 else (cx, cy)
+                    panel.size = (abs(diff), ch)
+            else:
+                translate.y = diff
+                if panel is not None:
+                    panel.pos = (cx, cy + ch + diff) if diff < 0 else (cx, cy)
+                    panel.size = (cw, abs(diff))
+
+        trigger = Clock.create_trigger(apply_diff, -1)
+        deletes = False
+        try:
+            with ak.transform(c, use_outer_canvas=True) as ig:
+                ig.add(translate := Translate())
+                if panel is not None:
+                    panel.size_hint = (None, None)
+                    self.dispatch("on_s2d_actions_open", c, panel)
+                    Window.add_widget(panel)
+                async with (
+                    ak.move_on_when(touch.ud["kivyx_end_event"].wait()),
+                    ak.event_freq(Window, "on_touch_move", filter=is_the_same_touch) as on_touch_move,
+                ):
+                    while True:
+                        await on_touch_move()
+                        # The touch is in the window coordinates here.
+                        diff = (touch.x - touch.ox) if horizontal else (touch.y - touch.oy)
+                        trigger()
+                if abs(diff) > self.s2d_delete_threshold:
+                    deletes = True
+                    return
+                if panel is None or abs(diff) < self.s2d_actions_size:
+                    return
+                # Keeps the actions open.
+                diff = self.s2d_actions_size if diff > 0 else -self.s2d_actions_size
+                trigger()
+                self.__close_event = close_event = ak.Event()
+                try:
+                    await ak.wait_any(
+                        close_event.wait(),
+                        ak.event(Window, "on_touch_down", filter=lambda w, t: not panel.collide_point(*t.pos)),
+                    )
+                finally:
+                    self.__close_event = None
+        finally:
+            trigger.cancel()
+            if panel is not None:
+                Window.remove_widget(panel)
+                self.dispatch("on_s2d_actions_close", c, panel)
+                _action_panel_pool.release(factory, panel)
+            if deletes:
+                self.dispatch("on_swipe2delete", self, c)
@@ -8,6 +8,8 @@ from kivy.properties import BoundedNumericProperty, NumericProperty, ObjectPrope
 
 import asynckivy as ak
 
+from kivyx import setup_events
+from kivyx.latency import stamp
 from kivyx.touch_filters import is_opos_colliding, is_opos_colliding_and_not_wheel
 
 
@@ -28,6 +30,7 @@ class KXTapGestureRecognizer:
         '''
 
     def __init__(self, **kwargs):
+        setup_events()
         self.__main_task = ak.dummy_task
         self.register_event_type("on_tap")
         super().__init__(**kwargs)
@@ -60,6 +63,7 @@ class KXTapGestureRecognizer:
             if self.collide_point(*from_window_to_parent(*touch.pos)):
                 e_access.claim()
                 self.dispatch("on_tap", touch)
+                stamp("tap", touch)
 
 
 class KXMultiTapGestureRecognizer:
@@ -79,6 +83,7 @@ class KXMultiTapGestureRecognizer:
         '''
 
     def __init__(self, **kwargs):
+        setup_events()
         self.__main_task = ak.dummy_task
         self.register_event_type("on_multi_tap")
         super().__init__(**kwargs)
@@ -128,6 +133,7 @@ class KXMultiTapGestureRecognizer:
                         break
             if n_taps:
                 self.dispatch("on_multi_tap", n_taps, accepted_touches)
+                stamp("multi_tap", accepted_touches[-1])
 
 
 class ResettableTimer:
@@ -1,15 +1,14 @@
 __all__ = ("KXTouchRippleBehavior", )
 
-from typing import Self
 from functools import partial
 import math
 from kivy.clock import Clock
 from kivy.animation import AnimationTransition
 from kivy.properties import NumericProperty, StringProperty, ColorProperty, BooleanProperty, OptionProperty
-from kivy.graphics import InstructionGroup, Color, Ellipse
+from kivy.graphics import InstructionGroup, Color, Ellipse, RenderContext, Rectangle
 import asynckivy as ak
-from asynckivy import anim_attrs, run_as_main, wait_any
 
+from kivyx import setup_events
 from kivyx.touch_filters import is_opos_colliding_and_not_wheel
 
 
@@ -51,7 +50,32 @@ class KXTouchRippleBehavior:
     '''The canvas on which ripples are drawn.
     '''
 
+    ripple_renderer = OptionProperty("instructions", options=("instructions", "shader"))
+    '''
+    How ripples are drawn.
+
+    * ``"instructions"`` (default): Each ripple is a :class:`~kivy.graphics.Color` and an
+      :class:`~kivy.graphics.Ellipse`.
+    * ``"shader"``: All the ripples of the widget are drawn by a fragment shader on a single quad, and only its
+      uniforms are updated while they animate. Up to 8 ripples per widget can be shown at the same time.
+      Unlike the other one, this renderer clips ripples to the widget's bounding box.
+    '''
+
+    ripple_clip_radius = NumericProperty(0)
+    '''The corner radius of the area ripples are clipped to. Only used by the ``"shader"`` renderer.'''
+
+    max_concurrent_ripples = 32
+    '''
+    (class attribute) The maximum number of ripples that can be shown at the same time across all the widgets.
+    When a new ripple would exceed it, the oldest one is removed right away.
+
+    .. code-block::
+
+        KXTouchRippleBehavior.max_concurrent_ripples = 8
+    '''
+
     def __init__(self, **kwargs):
+        setup_events()
         self.__main_task = ak.dummy_task
         t = Clock.schedule_once(self.__reset)
         f = self.fbind
@@ -60,11 +84,14 @@ class KXTouchRippleBehavior:
         f("ripple_fadeout_curve", t)
         f("ripple_allow_multiple", t)
         f("ripple_draw_on", t)
+        f("ripple_renderer", t)
+        self.__quad = None
         super().__init__(**kwargs)
 
     # Python's name mangling is weird. This method cannot be named '__reset'.
     def _KXTouchRippleBehavior__reset(self, __):
         self.__main_task.cancel()
+        _ripple_driver.discard_ripples_of(self)
         if self.disabled:
             return
         self.__main_task = ak.managed_start(self.__main())
@@ -79,59 +106,243 @@ class KXTouchRippleBehavior:
                 draw_target = draw_target.after
             case "canvas.before":
                 draw_target = draw_target.before
-        generate_ripple = partial(
-            self.__generate_ripple, draw_target,
-            getattr(AnimationTransition, self.ripple_growth_curve),
-            getattr(AnimationTransition, self.ripple_fadeout_curve),
-            self,
-        )
-        if self.ripple_allow_multiple:
-            async with ak.open_nursery() as nursery:
-                start = nursery.start
-                while True:
-                    __, touch = await on_touch_down()
-                    start(generate_ripple(touch))
+        growth_curve = getattr(AnimationTransition, self.ripple_growth_curve)
+        fadeout_curve = getattr(AnimationTransition, self.ripple_fadeout_curve)
+        allow_multiple = self.ripple_allow_multiple
+        if self.ripple_renderer == "shader":
+            if (quad := self.__quad) is None:
+                quad = self.__quad = _RippleQuad()
         else:
-            while True:
-                __, touch = await on_touch_down()
-                await generate_ripple(touch)
+            quad = None
+        driver = _ripple_driver
+        while True:
+            __, touch = await on_touch_down()
+            if allow_multiple or not driver.has_ripples_of(self):
+                driver.add_ripple(self, draw_target, growth_curve, fadeout_curve, touch, quad)
+
+
+class _Ripple:
+    __slots__ = (
+        "widget", "draw_target", "ig", "color", "ellipse", "quad", "ud", "fades_on_exclusive_access",
+        "cx", "cy", "initial_radius", "final_radius", "growth_duration", "growth_curve",
+        "fadeout_duration", "fadeout_curve", "alpha", "radius", "opacity", "elapsed_time", "is_fading",
+    )
+
+
+_RIPPLE_SHADER_CAPACITY = 8
+
+_RIPPLE_FS = f'''
+$HEADER$
+uniform vec2 quad_pos;
+uniform vec2 quad_size;
+uniform vec4 ripple_color;
+uniform float clip_radius;
+uniform vec4 ripples[{_RIPPLE_SHADER_CAPACITY}];  // center_x, center_y, radius, opacity
+uniform int n_ripples;
+
+void main(void) {{
+    vec2 p = quad_pos + tex_coord0 * quad_size;
+    float a = 0.0;
+    for (int i = 0; i < {_RIPPLE_SHADER_CAPACITY}; i++) {{
+        if (i >= n_ripples) break;
+        vec4 r = ripples[i];
+        // blends the overlapping ripples in the same way as drawing them one by one does
+        a = 1.0 - (1.0 - a) * (1.0 - r.w * clamp(r.z - distance(p, r.xy) + 0.5, 0.0, 1.0));
+    }}
+    // clips to the rounded rectangle
+    vec2 half_size = quad_size * 0.5;
+    vec2 q = abs(p - quad_pos - half_size) - (half_size - clip_radius);
+    float d = length(max(q, 0.0)) + min(max(q.x, q.y), 0.0) - clip_radius;
+    a *= clamp(0.5 - d, 0.0, 1.0);
+    gl_FragColor = vec4(ripple_color.rgb, ripple_color.a * a);
+}}
+'''
+
+
+class _RippleQuad:
+    '''A quad that draws all the ripples of a widget with a fragment shader.'''
+    __slots__ = ("rc", "rect", "ripples", "draw_target", )
+
+    def __init__(self):
+        self.rc = rc = RenderContext(fs=_RIPPLE_FS, use_parent_projection=True, use_parent_modelview=True)
+        with rc:
+            self.rect = Rectangle()
+        self.ripples = []
+        self.draw_target = None
+
+    def activate(self, widget, draw_target):
+        x, y = widget.to_local(*widget.pos)
+        self.rect.pos = (x, y)
+        self.rect.size = size = widget.size
+        rc = self.rc
+        rc['quad_pos'] = [float(x), float(y)]
+        rc['quad_size'] = [float(v) for v in size]
+        rc['ripple_color'] = [float(v) for v in widget.ripple_color]
+        rc['clip_radius'] = float(min(widget.ripple_clip_radius, min(size) / 2))
+        self.draw_target = draw_target
+        draw_target.add(rc)
+
+    def deactivate(self):
+        self.draw_target.remove(self.rc)
+        self.draw_target = None
+
+    def upload(self):
+        rs = self.ripples
+        rc = self.rc
+        rc['n_ripples'] = len(rs)
+        # Kivy only accepts a uniform array as a list of lists.
+        rc['ripples'] = [[r.cx, r.cy, r.radius, r.opacity] for r in rs] + \
+            [[0., 0., 0., 0.]] * (_RIPPLE_SHADER_CAPACITY - len(rs))
+
+
+class _RippleDriver:
+    '''
+    Animates the ripples of all the :class:`KXTouchRippleBehavior` s from a single per-frame callback,
+    which starts when a ripple is added and stops when no ripple is left. The graphics instructions of finished
+    ripples are pooled and reused.
+    '''
+    __slots__ = ("_ripples", "_pool", "_clock_event", "__weakref__", )
+
+    max_pooled = 32
+    '''The maximum number of the instruction sets kept for reuse.'''
+
+    def __init__(self):
+        self._ripples = []  # in the order they were added
+        self._pool = []  # [(InstructionGroup, Color, Ellipse), ]
+        self._clock_event = None
+
+    def has_ripples_of(self, widget) -> bool:
+        return any(r.widget is widget for r in self._ripples)
+
+    def discard_ripples_of(self, widget):
+        ripples = self._ripples
+        for r in [r for r in ripples if r.widget is widget]:
+            ripples.remove(r)
+            self._release(r)
+
+    def add_ripple(self, widget, draw_target, growth_curve, fadeout_curve, touch, quad: _RippleQuad = None):
+        ripples = self._ripples
+        while len(ripples) >= KXTouchRippleBehavior.max_concurrent_ripples:
+            self._release(ripples.pop(0))
+        if quad is not None and len(quad.ripples) >= _RIPPLE_SHADER_CAPACITY:
+            r = quad.ripples[0]
+            ripples.remove(r)
+            self._release(r)
+
+        r = _Ripple()
+        r.widget = widget
+        r.draw_target = draw_target
+        r.quad = quad
+        r.ud = touch.ud
+        r.fades_on_exclusive_access = widget.ripple_fadeout_on_exclusive_access
+        r.cx, r.cy = widget.to_local(*touch.opos)  # center of the ripple
+        r.radius = r.initial_radius = widget.ripple_initial_size / 2
+        final_diameter = widget.ripple_final_size
+        r.final_radius = _calc_enclosing_circle_radius(touch.opos, widget) if final_diameter is None \
+            else final_diameter / 2
+        r.growth_duration = widget.ripple_growth_duration
+        r.growth_curve = growth_curve
+        r.fadeout_duration = widget.ripple_fadeout_duration
+        r.fadeout_curve = fadeout_curve
+        r.opacity = 1.
+        r.elapsed_time = 0.
+        r.is_fading = False
+        if quad is None:
+            if self._pool:
+                r.ig, r.color, r.ellipse = self._pool.pop()
+                r.color.rgba = widget.ripple_color
+            else:
+                r.ig = ig = InstructionGroup()
+                ig.add(color := Color(*widget.ripple_color))
+                ig.add(ellipse := Ellipse())
+                r.color = color
+                r.ellipse = ellipse
+            r.alpha = r.color.a
+            self._set_radius(r, r.radius)
+            draw_target.add(r.ig)
+        else:
+            if not quad.ripples:
+                quad.activate(widget, draw_target)
+            quad.ripples.append(r)
+            quad.upload()
+        ripples.append(r)
+        if self._clock_event is None:
+            self._clock_event = Clock.schedule_interval(self._update, 0)
 
     @staticmethod
-    async def __generate_ripple(draw_target, growth_curve, fadeout_curve, self: Self, touch):
-        cx, cy = self.to_local(*touch.opos)  # center of the ripple
-        diameter = self.ripple_initial_size
-        radius = diameter / 2
-        ellipse = Ellipse(
-            size=(diameter, diameter),
-            pos=(cx - radius, cy - radius),
-        )
-
-        draw_target.add(ig := InstructionGroup())
-        try:
-            ig.add(color := Color(*self.ripple_color))
-            ig.add(ellipse)
-            final_diameter = self.ripple_final_size
-            if final_diameter is None:
-                final_radius = _calc_enclosing_circle_radius(touch.opos, self)
-                final_diameter = final_radius * 2
+    def _set_radius(r: _Ripple, radius):
+        d = radius * 2
+        e = r.ellipse
+        e.pos = (r.cx - radius, r.cy - radius)
+        e.size = (d, d)
+
+    def _release(self, r: _Ripple):
+        if (quad := r.quad) is None:
+            r.draw_target.remove(r.ig)
+            if len(self._pool) < self.max_pooled:
+                self._pool.append((r.ig, r.color, r.ellipse))
+            return
+        quad.ripples.remove(r)
+        if quad.ripples:
+            quad.upload()
+        else:
+            quad.deactivate()
+
+    def _update(self, dt, min=min):
+        ripples = self._ripples
+        finished = None
+        dirty_quads = None
+        set_radius = self._set_radius
+        for r in ripples:
+            r.elapsed_time = t = r.elapsed_time + dt
+            if not r.is_fading:
+                ud = r.ud
+                if ud["kivyx_end_event"].is_fired or \
+                        (r.fades_on_exclusive_access and ud["kivyx_exclusive_access"].has_been_claimed):
+                    # Like the growth animation being cancelled, the ripple stays at its current size.
+                    r.is_fading = True
+                    r.elapsed_time = t = 0.
+                elif r.radius != r.final_radius:
+                    p = min(t / r.growth_duration, 1.) if r.growth_duration else 1.
+                    ir = r.initial_radius
+                    r.radius = radius = r.final_radius if p == 1. else ir + (r.final_radius - ir) * r.growth_curve(p)
+                    if (quad := r.quad) is None:
+                        set_radius(r, radius)
+                    elif dirty_quads is None:
+                        dirty_quads = {quad, }
+                    else:
+                        dirty_quads.add(quad)
+                    continue
+                else:
+                    continue
+            p = min(t / r.fadeout_duration, 1.) if r.fadeout_duration else 1.
+            if p == 1.:
+                if finished is None:
+                    finished = []
+                finished.append(r)
+                continue
+            r.opacity = opacity = 1. - r.fadeout_curve(p)
+            if (quad := r.quad) is None:
+                r.color.a = r.alpha * opacity
+            elif dirty_quads is None:
+                dirty_quads = {quad, }
             else:
-                final_radius = final_diameter / 2
-
-            wait_end = touch.ud["kivyx_end_event"].wait
-            async with run_as_main(
-                wait_any(wait_end(), touch.ud["kivyx_exclusive_access"].wait())
-                if self.ripple_fadeout_on_exclusive_access else wait_end()
-            ):
-                await anim_attrs(
-                    ellipse,
-                    size=(final_diameter, final_diameter, ),
-                    pos=(cx - final_radius, cy - final_radius),
-                    duration=self.ripple_growth_duration,
-                    transition=growth_curve,
-                )
-            await anim_attrs(color, a=0, duration=self.ripple_fadeout_duration, transition=fadeout_curve)
-        finally:
-            draw_target.remove(ig)
+                dirty_quads.add(quad)
+        if finished is not None:
+            for r in finished:
+                ripples.remove(r)
+                self._release(r)
+                if dirty_quads is not None:
+                    dirty_quads.discard(r.quad)
+        if dirty_quads is not None:
+            for quad in dirty_quads:
+                quad.upload()
+        if not ripples:
+            self._clock_event = None
+            return False
+
+
+_ripple_driver = _RippleDriver()
 
 
 def _calc_enclosing_circle_radius(center_of_circle, widget, max=max, sqrt=math.sqrt):
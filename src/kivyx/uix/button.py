@@ -1,41 +1,118 @@
 __all__ = ("KXButton", "KXMultiTapButton", )
 
-from kivy.properties import ColorProperty
-from kivy.lang import Builder
+from kivy.properties import ColorProperty, BooleanProperty
+from kivy.graphics import (
+    InstructionGroup, Color, Rectangle, RoundedRectangle, StencilPush, StencilUse, StencilUnUse, StencilPop,
+)
 from kivy.uix.label import Label
 
 
 from kivyx.uix.behaviors.tap import KXTapGestureRecognizer, KXMultiTapGestureRecognizer
 from kivyx.uix.behaviors.touchripple import KXTouchRippleBehavior
 
+_CORNER_RADIUS = 10.  # the default radius of RoundedRectangle
 
-class KXButton(KXTouchRippleBehavior, KXTapGestureRecognizer, Label):
+
+class _ButtonBackground:
     background_color = ColorProperty((.4, .2, .8, 1))
     background_disabled_color = ColorProperty((.2, .2, .4, 1))
 
+    stencil_free = BooleanProperty(False)
+    '''
+    If set to False (the default), the button draws its rounded background through the stencil buffer, which
+    clips everything drawn on it.
+    If set to True, the background is drawn as a single :class:`~kivy.graphics.RoundedRectangle` and ripples are
+    clipped to it by the ``"shader"`` :attr:`ripple_renderer`, which avoids the stencil passes. Only the ripples
+    are clipped then. The :attr:`ripple_renderer` and :attr:`ripple_clip_radius` set before are put back when this
+    is set back to False.
+    '''
 
-class KXMultiTapButton(KXTouchRippleBehavior, KXMultiTapGestureRecognizer, Label):
-    background_color = ColorProperty((.4, .2, .8, 1))
-    background_disabled_color = ColorProperty((.2, .2, .4, 1))
+    def __init__(self, **kwargs):
+        self._bg_before = InstructionGroup()
+        self._bg_after = InstructionGroup()
+        self._bg_shapes = ()
+        self._bg_color = None
+        self._bg_is_batched = False
+        self._saved_ripple_settings = None  # the user's (ripple_renderer, ripple_clip_radius) while overridden
+        super().__init__(**kwargs)
+        self.canvas.before.insert(0, self._bg_before)
+        self.canvas.after.insert(0, self._bg_after)
+        self._build_background()
+        f = self.fbind
+        f("stencil_free", self._build_background)
+        f("pos", self._update_background)
+        f("size", self._update_background)
+        f("disabled", self._update_background_color)
+        f("background_color", self._update_background_color)
+        f("background_disabled_color", self._update_background_color)
+
+    def _build_background(self, *args):
+        before = self._bg_before
+        after = self._bg_after
+        before.clear()
+        after.clear()
+        if self._bg_is_batched:
+            # The background is drawn by a KXBackgroundBatchBehavior.
+            self._bg_color = Color()
+            self._bg_shapes = ()
+            self._override_ripple_settings(True)
+            return
+        color = Color()
+        if self.stencil_free:
+            shape = RoundedRectangle()
+            before.add(color)
+            before.add(shape)
+            shapes = (shape, )
+            self._override_ripple_settings(True)
+        else:
+            self._override_ripple_settings(False)
+            mask = RoundedRectangle()
+            rect = Rectangle()
+            unmask = RoundedRectangle()
+            for inst in (StencilPush(), mask, StencilUse(), color, rect):
+                before.add(inst)
+            for inst in (StencilUnUse(), unmask, StencilPop()):
+                after.add(inst)
+            shapes = (mask, rect, unmask, )
+        self._bg_color = color
+        self._bg_shapes = shapes
+        self._update_background()
+        self._update_background_color()
+
+    def _override_ripple_settings(self, override: bool):
+        '''
+        Makes the ripples clipped to the rounded background by the ``"shader"`` renderer while the background is
+        drawn without the stencil buffer, and puts the user's settings back when it isn't.
+        '''
+        saved = self._saved_ripple_settings
+        if override:
+            if saved is None:
+                self._saved_ripple_settings = (self.ripple_renderer, self.ripple_clip_radius)
+            self.ripple_renderer = "shader"
+            self.ripple_clip_radius = _CORNER_RADIUS
+        elif saved is not None:
+            self._saved_ripple_settings = None
+            self.ripple_renderer, self.ripple_clip_radius = saved
+
+    def _set_background_batched(self, batched: bool):
+        if self._bg_is_batched is not batched:
+            self._bg_is_batched = batched
+            self._build_background()
+
+    def _update_background(self, *args):
+        pos = self.pos
+        size = self.size
+        for shape in self._bg_shapes:
+            shape.pos = pos
+            shape.size = size
+
+    def _update_background_color(self, *args):
+        self._bg_color.rgba = self.background_disabled_color if self.disabled else self.background_color
+
+
+class KXButton(_ButtonBackground, KXTouchRippleBehavior, KXTapGestureRecognizer, Label):
+    pass
 
 
-Builder.load_string('''
-<KXButton, KXMultiTapButton>:
-    canvas.before:
-        StencilPush:
-        RoundedRectangle:
-            pos: self.pos
-            size: self.size
-        StencilUse:
-        Color:
-            rgba: self.background_disabled_color if self.disabled else self.background_color
-        Rectangle:
-            pos: self.pos
-            size: self.size
-    canvas.after:
-        StencilUnUse:
-        RoundedRectangle:
-            pos: self.pos
-            size: self.size
-        StencilPop:
-''')
+class KXMultiTapButton(_ButtonBackground, KXTouchRippleBehavior, KXMultiTapGestureRecognizer, Label):
+    pass
@@ -3,58 +3,28 @@ __all__ = ('KXScrollView', )
 from functools import partial
 from collections import deque
 from contextlib import contextmanager, ExitStack
+from weakref import WeakSet
 
-from kivy.lang import Builder
 from kivy.clock import Clock
 from kivy.core.window import Window
 from kivy.uix.widget import Widget
+from kivy.graphics import (
+    InstructionGroup, PushMatrix, PopMatrix, Translate, Color, Rectangle, StencilPush, StencilUse, StencilUnUse,
+    StencilPop,
+)
 from kivy.uix.scrollview import ScrollView as SV
 from kivy.properties import NumericProperty, BooleanProperty, ObjectProperty, ReferenceListProperty, ColorProperty
 import asynckivy as ak
 
+from kivyx import setup_events
+from kivyx.latency import stamp
 from kivyx.touch_filters import is_opos_colliding
 from kivyx.effects.scroll import KXScrollEffect
 from kivyx.effects.dampedscroll import KXDampedScrollEffect
 
 
-Builder.load_string('''
-<KXScrollView>:
-    _content_x: self.content_x
-    _content_y: self.content_y
-    canvas.before:
-        PushMatrix:
-        Translate:
-            x: self.x
-            y: self.y
-        StencilPush
-        Rectangle:
-            pos: 0, 0
-            size: self.size
-        StencilUse:
-        Translate:
-            x: self.content_x
-            y: self.content_y
-    canvas.after:
-        Translate:
-            x: -self.content_x
-            y: -self.content_y
-        Color:
-            rgba: self.hbar_color
-        Rectangle:
-            size: self._hbar_length, self.hbar_thickness
-            pos: self.hbar_x, self.hbar_y
-        Color:
-            rgba: self.vbar_color
-        Rectangle:
-            size: self.vbar_thickness, self._vbar_length
-            pos: self.vbar_x, self.vbar_y
-        StencilUnUse
-        Rectangle:
-            pos: 0, 0
-            size: self.size
-        StencilPop:
-        PopMatrix:
-''')
+_autoscrollable_views: WeakSet['KXScrollView'] = WeakSet()
+'''KXScrollViews that can currently respond to :meth:`KXScrollView._autoscroll`.'''
 
 
 def clamp(value, min, max):
@@ -216,11 +186,26 @@ class KXScrollView(Widget):
     movement of the ScrollView content.
     '''
 
+    autoscroll_margin = NumericProperty("40dp")
+    '''
+    The width of the area along each edge of the KXScrollView in which a drag by
+    :class:`~kivyx.uix.behaviors.draggable.KXDraggableBehavior` makes the content scroll automatically.
+    Set this to 0 to disable the auto-scroll.
+    '''
+
+    autoscroll_max_speed = NumericProperty("1000dp")
+    '''
+    The auto-scroll speed, in pixels per second, when a drag is at the very edge of the KXScrollView.
+    The speed is proportional to how deep the drag is in the :attr:`autoscroll_margin`.
+    '''
+
     def __init__(self, **kwargs):
+        setup_events()
         self._main_task = ak.dummy_task
         self._effect_x = self._effect_y = None
         self._prev_content = None
         super().__init__(**kwargs)
+        self._build_graphics()
         self._is_in_the_middle_of_user_scroll = False
         self._cancel_user_scroll_signal = e = ak.ExclusiveEvent()
         self.cancel_user_scroll = e.fire
@@ -239,6 +224,79 @@ class KXScrollView(Widget):
         f("hbar_enabled", t)
         f("vbar_enabled", t)
 
+    def _build_graphics(self):
+        # Inserted at the front so that the canvas instructions of subclasses are drawn inside the scrolled
+        # and clipped area.
+        self.canvas.before.insert(0, before := InstructionGroup())
+        before.add(PushMatrix())
+        before.add(translate := Translate())
+        before.add(StencilPush())
+        before.add(mask := Rectangle(pos=(0, 0)))
+        before.add(StencilUse())
+        before.add(content_translate := Translate())
+        self.canvas.after.insert(0, after := InstructionGroup())
+        after.add(content_untranslate := Translate())
+        after.add(hbar_color := Color())
+        after.add(hbar := Rectangle())
+        after.add(vbar_color := Color())
+        after.add(vbar := Rectangle())
+        after.add(StencilUnUse())
+        after.add(unmask := Rectangle(pos=(0, 0)))
+        after.add(StencilPop())
+        after.add(PopMatrix())
+
+        def update_pos(self, pos):
+            translate.xy = pos
+
+        def update_size(self, size):
+            mask.size = size
+            unmask.size = size
+
+        def update_content_x(self, x):
+            self._content_x = x
+            content_translate.x = x
+            content_untranslate.x = -x
+
+        def update_content_y(self, y):
+            self._content_y = y
+            content_translate.y = y
+            content_untranslate.y = -y
+
+        def update_hbar_color(self, color):
+            hbar_color.rgba = color
+
+        def update_vbar_color(self, color):
+            vbar_color.rgba = color
+
+        def update_hbar(self, *args):
+            hbar.pos = (self.hbar_x, self.hbar_y)
+            hbar.size = (self._hbar_length, self.hbar_thickness)
+
+        def update_vbar(self, *args):
+            vbar.pos = (self.vbar_x, self.vbar_y)
+            vbar.size = (self.vbar_thickness, self._vbar_length)
+
+        # 'fbind()' holds plain functions strongly, which keeps these alive as long as the widget.
+        f = self.fbind
+        f("pos", update_pos)
+        f("size", update_size)
+        f("content_x", update_content_x)
+        f("content_y", update_content_y)
+        f("hbar_color", update_hbar_color)
+        f("vbar_color", update_vbar_color)
+        for name in ("hbar_x", "hbar_y", "_hbar_length", "hbar_thickness"):
+            f(name, update_hbar)
+        for name in ("vbar_x", "vbar_y", "_vbar_length", "vbar_thickness"):
+            f(name, update_vbar)
+        update_pos(self, self.pos)
+        update_size(self, self.size)
+        update_content_x(self, self.content_x)
+        update_content_y(self, self.content_y)
+        update_hbar_color(self, self.hbar_color)
+        update_vbar_color(self, self.vbar_color)
+        update_hbar(self)
+        update_vbar(self)
+
     def _reset(self, dt):
         self._main_task.cancel()
         if self.disabled:
@@ -294,6 +352,60 @@ class KXScrollView(Widget):
             touch.pop()
             return True
 
+    def _autoscroll(self, x, y, min=min) -> bool:
+        '''
+        Adjusts the momentum so that the content scrolls towards the edge near a given point.
+        This is called every frame, for each ongoing drag this KXScrollView contains, while the drag stays in
+        its :attr:`autoscroll_margin`.
+
+        :param x, y: The point in window coordinates.
+        :returns: Whether the point is in the :attr:`autoscroll_margin` and the content is actually being scrolled.
+        '''
+        margin = self.autoscroll_margin
+        if margin <= 0 or self._is_in_the_middle_of_user_scroll or (parent := self.parent) is None:
+            return False
+        x, y = parent.to_widget(x, y)
+        x -= self.x
+        y -= self.y
+        w, h = self.size
+        if not (0 <= x < w and 0 <= y < h):
+            return False
+        max_speed = self.autoscroll_max_speed
+        scrolling = False
+        if (e := self._effect_x) is not None:
+            m = min(margin, w / 2)
+            if x < m and self.content_x < self.content_max_x:
+                velocity = (m - x) / m * max_speed
+            elif x > w - m and self.content_x > self.content_min_x:
+                velocity = (w - m - x) / m * max_speed
+            else:
+                velocity = 0
+            if velocity:
+                e.velocity = velocity
+                e.activate()
+                scrolling = True
+        if (e := self._effect_y) is not None:
+            m = min(margin, h / 2)
+            if y < m and self.content_y < self.content_max_y:
+                velocity = (m - y) / m * max_speed
+            elif y > h - m and self.content_y > self.content_min_y:
+                velocity = (h - m - y) / m * max_speed
+            else:
+                velocity = 0
+            if velocity:
+                e.velocity = velocity
+                e.activate()
+                scrolling = True
+        return scrolling
+
+    @contextmanager
+    def _keep_accepting_autoscroll(self):
+        _autoscrollable_views.add(self)
+        try:
+            yield
+        finally:
+            _autoscrollable_views.discard(self)
+
     def stop_scroll_momentum(self):
         if (e := self._effect_x) is not None:
             e.deactivate()
@@ -453,6 +565,8 @@ class KXScrollView(Widget):
                         ec(self._keep_updating_vbar_y())
                 else:
                     ec(self._keep_updating_content_y_from_hint(c))
+                if self.do_scroll_x or self.do_scroll_y:
+                    ec(self._keep_accepting_autoscroll())
 
                 while True:
                     await ak.wait_any(
@@ -616,6 +730,7 @@ class KXScrollView(Widget):
                         self._content_y += dy
                     if do_scroll_x:
                         self._content_x += dx
+                    stamp("scroll", touch)
             finally:
                 self._is_in_the_middle_of_user_scroll = False
 
@@ -658,6 +773,7 @@ class KXScrollView(Widget):
                 while True:
                     await on_touch_move()
                     self._content_x += touch.dx * hbar2content_ratio
+                    stamp("scroll", touch)
         finally:
             self._is_in_the_middle_of_user_scroll = False
 
@@ -689,6 +805,7 @@ class KXScrollView(Widget):
                 while True:
                     await on_touch_move()
                     self._content_y += touch.dy * vbar2content_ratio
+                    stamp("scroll", touch)
         finally:
             self._is_in_the_middle_of_user_scroll = False
 
@@ -1,52 +1,15 @@
-__all__ = ("KXSwitch", )
+__all__ = ("KXSwitch", "count_active_transitions", )
 
+import math
+from kivy.metrics import dp
+from kivy.clock import Clock
 from kivy.properties import (
     ColorProperty, BooleanProperty, NumericProperty, ReferenceListProperty,
 )
-from kivy.lang import Builder
+from kivy.graphics import InstructionGroup, PushMatrix, PopMatrix, Translate, Color, RoundedRectangle, Ellipse
 from kivy.uix.widget import Widget
-import asynckivy as ak
 from kivyx.uix.behaviors.tap import KXTapGestureRecognizer
 
-Builder.load_string("""
-<KXSwitch>:
-    on_tap: self.active = not self.active
-    on_kv_post: self._setup_smoothing()
-    _track_half_width: self.track_width / 2
-    _track_half_height: self.track_height / 2
-    _padding: self.track_height / 16
-    _thumb_active_x: self._track_half_width - self.track_height + self._padding
-    _thumb_inactive_x: self._padding - self._track_half_width
-    _thumb_y: self._padding - self._track_half_height
-    _track_color:
-        (
-        self.track_disabled_color if self.disabled else
-        (self.track_active_color if self.active else self.track_inactive_color)
-        )
-    _thumb_x: self._thumb_active_x if self.active else self._thumb_inactive_x
-    _thumb_color:
-        (
-        self.thumb_disabled_color if self.disabled else
-        (self.thumb_active_color if self.active else self.thumb_inactive_color)
-        )
-    canvas:
-        PushMatrix:
-        Translate:
-            xy: self.center
-        Color:
-            group: "smoothing_target"
-        RoundedRectangle:
-            radius: (self._track_half_height, ) * 2
-            pos: -self._track_half_width, -self._track_half_height
-            size: self.track_size
-        Color:
-            group: "smoothing_target"
-        Ellipse:
-            group: "smoothing_target"
-            size: (self.track_height - self._padding * 2, ) * 2
-        PopMatrix:
-""")
-
 
 class KXSwitch(KXTapGestureRecognizer, Widget):
     '''
@@ -58,14 +21,10 @@ class KXSwitch(KXTapGestureRecognizer, Widget):
     track_active_color = ColorProperty("#B66AF7")
     track_inactive_color = ColorProperty("#888888")
     track_disabled_color = ColorProperty("#444444")
-    _track_color = ColorProperty()
 
     track_width = NumericProperty("64sp")
     track_height = NumericProperty("32sp")
     track_size = ReferenceListProperty(track_width, track_height)
-    _track_half_width = NumericProperty()
-    _track_half_height = NumericProperty()
-    _padding = NumericProperty()
     minimum_width = track_width
     minimum_height = track_height
     minimum_size = track_size
@@ -73,22 +32,145 @@ class KXSwitch(KXTapGestureRecognizer, Widget):
     thumb_active_color = ColorProperty("#FFFFFF")
     thumb_inactive_color = ColorProperty("#FFFFFF")
     thumb_disabled_color = ColorProperty("#666666")
-    _thumb_color = ColorProperty()
 
-    _thumb_active_x = NumericProperty()
-    _thumb_inactive_x = NumericProperty()
-    _thumb_x = NumericProperty()
-    _thumb_y = NumericProperty()
-    _thumb_pos = ReferenceListProperty(_thumb_x, _thumb_y)
+    def __init__(self, **kwargs):
+        # The values the graphics instructions smoothly follow. They are updated by '_update_graphics()'.
+        self._track_color = None
+        self._thumb_color = None
+        self._thumb_pos = None
+        self._trigger_update_graphics = t = Clock.create_trigger(self._update_graphics, -1)
+        super().__init__(**kwargs)
+        # inserted at the front so that the canvas instructions of subclasses are drawn on top of it
+        self.canvas.insert(0, ig := InstructionGroup())
+        ig.add(PushMatrix())
+        ig.add(translate := Translate())
+        ig.add(track_color := Color())
+        ig.add(track := RoundedRectangle())
+        ig.add(thumb_color := Color())
+        ig.add(thumb := Ellipse())
+        ig.add(PopMatrix())
+        self._translate = translate
+        self._track = track
+        self._thumb = thumb
+        self._transitions = (
+            _Transition(self, "_track_color", track_color, "rgba", 0.02),
+            _Transition(self, "_thumb_color", thumb_color, "rgba", 0.02),
+            _Transition(self, "_thumb_pos", thumb, "pos", dp(2)),
+        )
+        f = self.fbind
+        for name in (
+            "pos", "size", "track_width", "track_height", "active", "disabled",
+            "track_active_color", "track_inactive_color", "track_disabled_color",
+            "thumb_active_color", "thumb_inactive_color", "thumb_disabled_color",
+        ):
+            f(name, t)
+        t()
+
+    def on_tap(self, touch):
+        self.active = not self.active
 
     def collide_point(self, x, y) -> bool:
-        hw = self._track_half_width
-        hh = self._track_half_height
+        hw = self.track_width / 2
+        hh = self.track_height / 2
         cx, cy = self.center
         return cy - hh <= y < cy + hh and cx - hw <= x < cx + hw
 
-    def _setup_smoothing(self):
-        track_color, thumb_color, thumb_ellipse = self.canvas.get_group("smoothing_target")
-        ak.smooth_attr((self, "_thumb_color"), (thumb_color, "rgba"), min_diff=0.02)
-        ak.smooth_attr((self, "_track_color"), (track_color, "rgba"), min_diff=0.02)
-        ak.smooth_attr((self, "_thumb_pos"), (thumb_ellipse, "pos"))
+    def _update_graphics(self, dt):
+        track_width, track_height = self.track_size
+        hw = track_width / 2
+        hh = track_height / 2
+        padding = track_height / 16
+        thumb_diameter = track_height - padding * 2
+        self._translate.xy = self.center
+        track = self._track
+        track.radius = (hh, hh)
+        track.pos = (-hw, -hh)
+        track.size = (track_width, track_height)
+        self._thumb.size = (thumb_diameter, thumb_diameter)
+
+        active = self.active
+        if self.disabled:
+            track_color = self.track_disabled_color
+            thumb_color = self.thumb_disabled_color
+        elif active:
+            track_color = self.track_active_color
+            thumb_color = self.thumb_active_color
+        else:
+            track_color = self.track_inactive_color
+            thumb_color = self.thumb_inactive_color
+        thumb_pos = (hw - track_height + padding if active else padding - hw, padding - hh)
+
+        is_first_time = self._thumb_pos is None
+        self._track_color = tuple(track_color)
+        self._thumb_color = tuple(thumb_color)
+        self._thumb_pos = thumb_pos
+        start = _smoothing_driver.start
+        for t in self._transitions:
+            value = getattr(self, t.target_attr)
+            if is_first_time:
+                setattr(t.follower, t.follower_attr, value)
+            elif tuple(getattr(t.follower, t.follower_attr)) != value:
+                start(t)
+
+
+def count_active_transitions() -> int:
+    '''Returns the number of the :class:`KXSwitch` s' colors and thumb positions that are currently in motion.'''
+    return len(_smoothing_driver._transitions)
+
+
+class _Transition:
+    __slots__ = ("target", "target_attr", "follower", "follower_attr", "min_diff", )
+
+    def __init__(self, target, target_attr, follower, follower_attr, min_diff):
+        self.target = target
+        self.target_attr = target_attr
+        self.follower = follower
+        self.follower_attr = follower_attr
+        self.min_diff = min_diff
+
+
+class _SmoothingDriver:
+    '''
+    Makes the graphics instructions of all the :class:`KXSwitch` s smoothly follow their target values from a
+    single per-frame callback, which runs only while at least one of them is in motion.
+    It is the same exponential smoothing as :class:`asynckivy.smooth_attr`.
+    '''
+    __slots__ = ("_transitions", "_clock_event", "__weakref__", )
+
+    speed = 10.
+
+    def __init__(self):
+        self._transitions = {}  # used as an ordered set
+        self._clock_event = None
+
+    def start(self, transition):
+        self._transitions[transition] = None
+        if self._clock_event is None:
+            self._clock_event = Clock.schedule_interval(self._update, 0)
+
+    def _update(self, dt, getattr=getattr, setattr=setattr, zip=zip):
+        p = math.exp(-self.speed * dt)
+        finished = []
+        for t in self._transitions:
+            min_diff = t.min_diff
+            still_going = False
+            new_value = []
+            for t_elem, f_elem in zip(getattr(t.target, t.target_attr), getattr(t.follower, t.follower_attr)):
+                diff = f_elem - t_elem
+                if -min_diff < diff < min_diff:
+                    new_value.append(t_elem)
+                else:
+                    still_going = True
+                    new_value.append(t_elem + p * diff)
+            setattr(t.follower, t.follower_attr, new_value)
+            if not still_going:
+                finished.append(t)
+        transitions = self._transitions
+        for t in finished:
+            del transitions[t]
+        if not transitions:
+            self._clock_event = None
+            return False
+
+
+_smoothing_driver = _SmoothingDriver()
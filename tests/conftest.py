@@ -1 +1,9 @@
+import pytest
 from kivy.tests.fixtures import kivy_clock  # noqa: F401
+
+
+@pytest.fixture()
+def touch_driver(kivy_clock):
+    from kivyx.testing import TouchDriver
+    with TouchDriver(kivy_clock) as driver:
+        yield driver
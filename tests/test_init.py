@@ -0,0 +1,18 @@
+def test_import_does_not_create_window():
+    import sys
+    import subprocess
+    code = "import sys, kivyx; sys.exit('kivy.core.window' in sys.modules)"
+    assert subprocess.run([sys.executable, "-c", code]).returncode == 0
+
+
+def test_setup_events():
+    from kivy.tests.common import UnitTestTouch
+    import kivyx
+    kivyx.setup_events()
+    kivyx.setup_events()  # no effect
+    t = UnitTestTouch(0, 0)
+    t.touch_down()
+    assert not t.ud["kivyx_exclusive_access"].is_fired
+    assert not t.ud["kivyx_end_event"].is_fired
+    t.touch_up()
+    assert t.ud["kivyx_end_event"].is_fired
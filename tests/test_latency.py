@@ -0,0 +1,58 @@
+import math
+import pytest
+
+
+def test_histogram():
+    from kivyx.latency import LatencyHistogram
+    h = LatencyHistogram(.001, 100)
+    assert math.isnan(h.percentile(50))
+    for i in range(100):
+        h.add(i * .001 + .0005)
+    h.add(1.)  # exceeds the range
+    assert h.count == 101
+    assert h.percentile(50) == pytest.approx(.051)
+    assert h.percentile(99) == pytest.approx(.1)
+    assert h.percentile(100) == 1.
+    assert h.max == 1.
+
+
+@pytest.fixture()
+def drawing_touch_driver(touch_driver):
+    touch_driver.draw = True
+    return touch_driver
+
+
+def test_scroll_and_tap(drawing_touch_driver):
+    from kivy.core.window import Window
+    from kivy.uix.boxlayout import BoxLayout
+    from kivy.uix.widget import Widget
+    from kivyx.uix.scrollview import KXScrollView
+    from kivyx.uix.behaviors.tap import KXTapGestureRecognizer
+    from kivyx.latency import LatencyTracer
+    from kivyx.testing import drag, tap
+
+    class Tappable(KXTapGestureRecognizer, Widget):
+        pass
+
+    driver = drawing_touch_driver
+    root = BoxLayout(size_hint=(None, None), pos=(0, 0), size=(200, 100))
+    root.add_widget(sv := KXScrollView(do_scroll_x=False))
+    sv.add_widget(Widget(size_hint=(1, None), height=2000))
+    root.add_widget(Tappable())
+    Window.add_widget(root)
+    try:
+        driver.frame(2)
+        with LatencyTracer(time_source=lambda: driver.now) as tracer:
+            driver.play(drag((50, 90), (50, 10), duration=.5, rate=30))
+            driver.play(tap((150, 50)))
+            driver.frame(2)
+        assert not tracer.is_running
+    finally:
+        Window.remove_widget(root)
+    report = tracer.report()
+    assert list(report) == ["scroll", "tap"]
+    assert report["tap"]["count"] == 1
+    scroll = report["scroll"]
+    assert 0 < scroll["count"] <= 15
+    assert 0 < scroll["p50"] <= scroll["p95"] <= scroll["p99"] <= scroll["max"] <= driver.frame_duration + 1e-9
+
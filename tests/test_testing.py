@@ -0,0 +1,69 @@
+import pytest
+
+
+def test_events_are_put(touch_driver):
+    touch = touch_driver.down(10, 10)
+    assert not touch.ud["kivyx_exclusive_access"].is_fired
+    assert not touch.ud["kivyx_end_event"].is_fired
+    touch_driver.up(touch)
+    assert touch.ud["kivyx_end_event"].is_fired
+
+
+def test_timestamps_are_virtual(touch_driver):
+    from kivy.core.window import Window
+    from kivyx.testing import drag
+    times = []
+
+    def on_touch_move(w, t):
+        times.append(t.time_update - t.time_start)
+
+    Window.fbind("on_touch_move", on_touch_move)
+    try:
+        touch_driver.play(drag((10, 10), (100, 10), duration=.5, rate=10), speed=.5)
+    finally:
+        Window.funbind("on_touch_move", on_touch_move)
+    assert times == pytest.approx([.2, .4, .6, .8, 1.])
+
+
+def test_multi_tap(touch_driver):
+    from kivy.core.window import Window
+    from kivy.uix.widget import Widget
+    from kivyx.uix.behaviors.tap import KXMultiTapGestureRecognizer
+    from kivyx.testing import multi_tap
+
+    class Recognizer(KXMultiTapGestureRecognizer, Widget):
+        pass
+
+    n_taps = []
+    w = Recognizer(tap_max_count=3, pos=(0, 0), size=(100, 100))
+    w.bind(on_multi_tap=lambda w, n, touches: n_taps.append(n))
+    Window.add_widget(w)
+    try:
+        touch_driver.frame()
+        touch_driver.play(multi_tap((50, 50), 3))
+        touch_driver.wait(.5)
+        touch_driver.play(multi_tap((50, 50), 2, interval=.4))
+        touch_driver.wait(.5)
+    finally:
+        Window.remove_widget(w)
+    assert n_taps == [3, 1, 1]
+
+
+def test_fling_keeps_scrolling(touch_driver):
+    from kivy.core.window import Window
+    from kivy.uix.widget import Widget
+    from kivyx.uix.scrollview import KXScrollView
+    from kivyx.testing import fling
+
+    sv = KXScrollView(do_scroll_x=False, size_hint=(None, None), pos=(0, 0), size=(100, 100))
+    sv.add_widget(Widget(size_hint=(1, None), height=2000))
+    Window.add_widget(sv)
+    try:
+        touch_driver.frame(2)
+        y = sv.content_y
+        touch_driver.play(fling((50, 90), (50, 10)))
+        y_on_release = sv.content_y
+        touch_driver.wait(.2)
+        assert y > y_on_release > sv.content_y
+    finally:
+        Window.remove_widget(sv)
@@ -0,0 +1,78 @@
+import pytest
+
+
+@pytest.fixture()
+def gesture():
+    from kivyx.testing import merge, drag, tap
+    return list(merge(drag((10, 10), (100, 50), duration=.3), tap((200, 200), start=.1, button="left")))
+
+
+def record(touch_driver, path, gesture, speed=1.):
+    from kivyx.touch_trace import TouchTraceRecorder
+    with TouchTraceRecorder(path):
+        touch_driver.play(gesture, speed=speed)
+
+
+def test_round_trip(touch_driver, tmp_path, gesture):
+    from kivyx.touch_trace import TouchTrace
+    path = tmp_path / "trace.kxtt"
+    record(touch_driver, path, gesture)
+    with TouchTrace(path) as trace:
+        assert path.stat().st_size == 16 + 24 * len(gesture)
+        assert len(trace) == len(gesture)
+        assert trace.duration == pytest.approx(gesture[-1].time)
+        samples = list(trace)
+    assert [(s.etype, s.button) for s in samples] == [(s.etype, s.button) for s in gesture]
+    for actual, expected in zip(samples, gesture):
+        assert actual.time == pytest.approx(expected.time)
+        assert (actual.x, actual.y) == pytest.approx((expected.x, expected.y), abs=.01)
+    uids = {}
+    for actual, expected in zip(samples, gesture):
+        assert uids.setdefault(expected.uid, actual.uid) == actual.uid
+    assert len(set(uids.values())) == 2
+
+
+def test_replay_faster(touch_driver, tmp_path, gesture):
+    from kivyx.touch_trace import TouchTrace
+    original = tmp_path / "original.kxtt"
+    replayed = tmp_path / "replayed.kxtt"
+    record(touch_driver, original, gesture)
+    with TouchTrace(original) as trace:
+        record(touch_driver, replayed, trace, speed=2.)
+    with TouchTrace(replayed) as trace:
+        assert len(trace) == len(gesture)
+        assert trace.duration == pytest.approx(gesture[-1].time / 2.)
+
+
+def test_play_touch_trace(touch_driver, tmp_path, gesture):
+    import asynckivy as ak
+    from kivy.core.window import Window
+    from kivyx.touch_trace import TouchTrace, play_touch_trace
+    path = tmp_path / "trace.kxtt"
+    record(touch_driver, path, gesture)
+    n_events = 0
+
+    def count(*args):
+        nonlocal n_events
+        n_events += 1
+
+    for name in ("on_touch_down", "on_touch_move", "on_touch_up"):
+        Window.fbind(name, count)
+    try:
+        with TouchTrace(path) as trace:
+            task = ak.start(play_touch_trace(trace, speed=3.))
+            touch_driver.wait(gesture[-1].time / 3.)
+            touch_driver.frame()
+            assert task.finished
+    finally:
+        for name in ("on_touch_down", "on_touch_move", "on_touch_up"):
+            Window.funbind(name, count)
+    assert n_events == len(gesture)
+
+
+def test_not_a_trace(tmp_path):
+    from kivyx.touch_trace import TouchTrace
+    path = tmp_path / "trace.kxtt"
+    path.write_bytes(b"not a trace at all")
+    with pytest.raises(ValueError):
+        TouchTrace(path)
@@ -0,0 +1,32 @@
+def test_background_batch(kivy_clock):
+    from kivy.uix.boxlayout import BoxLayout
+    from kivyx.uix.button import KXButton
+    from kivyx.uix.behaviors.backgroundbatch import KXBackgroundBatchBehavior
+
+    class BatchedBoxLayout(KXBackgroundBatchBehavior, BoxLayout):
+        pass
+
+    layout = BatchedBoxLayout()
+    buttons = [KXButton(background_color=(i / 4, 0, 0, 1)) for i in range(3)]
+    for b in buttons:
+        layout.add_widget(b)
+        assert not b._bg_before.children
+        assert b.ripple_renderer == "shader"
+    kivy_clock.tick()
+    mesh = layout.canvas.before.children[-1].children[-1]
+    assert len(mesh.vertices) == 3 * 40
+    assert len(mesh.indices) == 3 * 6
+    assert mesh.vertices[80 + 6] == .5  # the red component of the third background
+
+    layout.remove_widget(buttons[0])
+    assert buttons[0]._bg_before.children
+    assert buttons[0].ripple_renderer == "instructions"
+    assert buttons[0].ripple_clip_radius == 0
+    kivy_clock.tick()
+    assert len(mesh.vertices) == 2 * 40
+    assert len(mesh.indices) == 2 * 6
+    assert mesh.vertices[6] == .5  # the third background took the place of the first one
+
+    buttons[2].disabled = True
+    kivy_clock.tick()
+    assert mesh.vertices[6] == buttons[2].background_disabled_color[0]
@@ -0,0 +1,371 @@
+import pytest
+
+
+@pytest.fixture()
+def board(kivy_clock):
+    from kivy.core.window import Window
+    from kivy.uix.label import Label
+    from kivy.uix.boxlayout import BoxLayout
+    from kivyx.uix.behaviors.draggable import KXDraggableBehavior, KXDragReorderBehavior
+
+    class Draggable(KXDraggableBehavior, Label):
+        pass
+
+    class ReorderableBox(KXDragReorderBehavior, BoxLayout):
+        pass
+
+    root = BoxLayout()
+    left = ReorderableBox(orientation="vertical", drag_classes=["test", ])
+    right = ReorderableBox(orientation="vertical", drag_classes=["test", ])
+    for i in range(4):
+        left.add_widget(Draggable(text=str(i), drag_cls="test", drag_timeout=0))
+    root.add_widget(left)
+    root.add_widget(right)
+    Window.add_widget(root)
+    yield left, right
+    Window.remove_widget(root)
+
+
+def tick(clock, n=2):
+    for __ in range(n):
+        clock.tick()
+
+
+def drag(clock, draggable, to_x, to_y, *, steps=10):
+    from kivy.tests.common import UnitTestTouch
+    x, y = draggable.to_window(*draggable.center)
+    touch = UnitTestTouch(x, y)
+    touch.touch_down()
+    tick(clock)
+    for i in range(1, steps + 1):
+        p = i / steps
+        touch.touch_move(x + (to_x - x) * p, y + (to_y - y) * p)
+        tick(clock, 1)
+    touch.touch_up()
+    tick(clock, 20)
+
+
+@pytest.mark.parametrize("drag_mode", ["reparent", "transform"])
+def test_move_to_another_layout(kivy_clock, board, drag_mode):
+    left, right = board
+    tick(kivy_clock)
+    d = left.children[0]
+    d.drag_mode = drag_mode
+    drag(kivy_clock, d, *right.to_window(*right.center))
+    assert [c.text for c in left.children] == ["2", "1", "0"]
+    assert [c.text for c in right.children] == ["3"]
+    assert d.drag_state is None
+
+
+@pytest.mark.parametrize("drag_mode", ["reparent", "transform"])
+def test_reorder_within_the_same_layout(kivy_clock, board, drag_mode):
+    left, right = board
+    tick(kivy_clock)
+    d = left.children[-1]
+    d.drag_mode = drag_mode
+    drag(kivy_clock, d, *left.to_window(left.center_x, left.y + 2))
+    assert [c.text for c in left.children] == ["0", "3", "2", "1"]
+    assert not right.children
+
+
+@pytest.mark.parametrize("drag_mode", ["reparent", "transform"])
+def test_group_drag(kivy_clock, board, drag_mode):
+    left, right = board
+    tick(kivy_clock)
+    w0, w1, w2, w3 = left.children[::-1]
+    w1.drag_mode = drag_mode
+    w1.drag_group = [w3, w1, w0]
+    drag(kivy_clock, w1, *right.to_window(*right.center))
+    assert [c.text for c in left.children] == ["2"]
+    assert [c.text for c in right.children] == ["0", "3", "1"]
+
+
+@pytest.mark.parametrize("drag_mode", ["reparent", "transform"])
+def test_group_drag_fail(kivy_clock, board, drag_mode):
+    left, right = board
+    right.drag_classes = []
+    tick(kivy_clock)
+    w0, w1, w2, w3 = left.children[::-1]
+    w1.drag_mode = drag_mode
+    w1.drag_group = [w3, w0]
+    drag(kivy_clock, w1, *right.to_window(*right.center))
+    while w1.is_being_dragged:  # wait for the animation played by on_drag_fail()
+        kivy_clock.tick()
+    assert [c.text for c in left.children] == ["3", "2", "1", "0"]
+    assert not right.children
+    assert w1.canvas.before.length() == 0
+
+
+@pytest.mark.parametrize("drag_mode", ["reparent", "transform"])
+def test_reorder_animation(kivy_clock, board, drag_mode):
+    from kivy.tests.common import UnitTestTouch
+    from kivy.graphics import Translate
+    from kivyx.uix.behaviors._reorderanimator import _reorder_animator
+    left, right = board
+    left.reorder_anim_duration = .1
+    tick(kivy_clock)
+    d = left.children[-1]
+    d.drag_mode = drag_mode
+    w1 = left.children[-2]
+    touch = UnitTestTouch(*d.to_window(*d.center))
+    touch.touch_down()
+    tick(kivy_clock)
+    touch.touch_move(touch.x, w1.to_window(*w1.center)[1])
+    tick(kivy_clock)
+    assert _reorder_animator.is_animating(w1)
+    assert any(isinstance(i, Translate) for i in w1.canvas.before.children[1].children)
+    touch.touch_up()
+    while _reorder_animator.is_active or d.is_being_dragged:
+        kivy_clock.tick()
+    assert not w1.canvas.before.children
+    assert [c.text for c in left.children] == ["3", "2", "0", "1"]
+
+
+def test_transform_mode_does_not_reparent_during_drag(kivy_clock, board):
+    from kivy.tests.common import UnitTestTouch
+    left, right = board
+    tick(kivy_clock)
+    d = left.children[0]
+    d.drag_mode = "transform"
+    touch = UnitTestTouch(*d.to_window(*d.center))
+    touch.touch_down()
+    tick(kivy_clock)
+    touch.touch_move(touch.x + 30, touch.y + 40)
+    tick(kivy_clock)
+    assert d.is_being_dragged
+    assert d.parent is left
+    assert d.size_hint == [1, 1]
+    touch.touch_up()
+    tick(kivy_clock, 20)
+    assert d.parent is left
+    assert not d.canvas.before.children
+
+
+@pytest.mark.parametrize("drag_mode", ["reparent", "transform"])
+def test_ongoing_drags(kivy_clock, board, drag_mode):
+    from kivy.tests.common import UnitTestTouch
+    from kivyx.uix.behaviors.draggable import ongoing_drags, drag_registry
+    left, right = board
+    tick(kivy_clock)
+    d = left.children[0]
+    d.drag_mode = drag_mode
+    changes = []
+    uid = drag_registry.fbind("on_change", lambda r, ctx, added: changes.append((ctx.draggable, added)))
+    touch = UnitTestTouch(*d.to_window(*d.center))
+    touch.touch_down()
+    tick(kivy_clock)
+    assert ongoing_drags() == [d]
+    assert ongoing_drags("test") == [d]
+    assert ongoing_drags("another") == []
+    assert drag_registry.count == 1
+    d.drag_cancel()
+    tick(kivy_clock)
+    assert ongoing_drags() == []
+    assert drag_registry.count == 0
+    assert changes == [(d, True), (d, False)]
+    touch.touch_up()
+    drag_registry.unbind_uid("on_change", uid)
+
+
+@pytest.mark.parametrize("drag_mode", ["reparent", "transform"])
+def test_autoscroll(kivy_clock, drag_mode):
+    from kivy.core.window import Window
+    from kivy.tests.common import UnitTestTouch
+    from kivy.uix.label import Label
+    from kivy.uix.boxlayout import BoxLayout
+    from kivyx.uix.scrollview import KXScrollView
+    from kivyx.uix.behaviors.draggable import KXDraggableBehavior, KXDragReorderBehavior, _autoscroll_driver
+
+    class Draggable(KXDraggableBehavior, Label):
+        pass
+
+    class ReorderableBox(KXDragReorderBehavior, BoxLayout):
+        pass
+
+    sv = KXScrollView(do_scroll_x=False, size_hint=(None, None), size=(200, 200), autoscroll_margin=50)
+    box = ReorderableBox(orientation="vertical", drag_classes=["test", ], size_hint=(1, None), height=2000)
+    for i in range(20):
+        box.add_widget(Draggable(text=str(i), drag_cls="test", drag_timeout=0, drag_mode=drag_mode))
+    sv.add_widget(box)
+    Window.add_widget(sv)
+    try:
+        tick(kivy_clock, 3)
+        assert sv.content_y == 0
+        d = box.children[0]
+        touch = UnitTestTouch(100, 50)
+        touch.touch_down()
+        tick(kivy_clock)
+        touch.touch_move(100, 80)
+        touch.touch_move(100, 190)
+        tick(kivy_clock, 10)
+        assert d.is_being_dragged
+        assert sv.content_y < 0
+
+        assert _autoscroll_driver._clock_event is not None
+
+        # Leaving the margin stops the auto-scroll, and the content doesn't keep coasting.
+        touch.touch_move(100, 100)
+        tick(kivy_clock, 2)
+        assert _autoscroll_driver._clock_event is None
+        assert sv._effect_y.velocity == 0
+        content_y = sv.content_y
+        tick(kivy_clock, 5)
+        assert sv.content_y == pytest.approx(content_y)
+        touch.touch_up()
+        tick(kivy_clock, 20)
+    finally:
+        Window.remove_widget(sv)
+
+
+def test_autoscroll_nested(kivy_clock):
+    from kivy.core.window import Window
+    from kivy.tests.common import UnitTestTouch
+    from kivy.uix.label import Label
+    from kivy.uix.widget import Widget
+    from kivy.uix.boxlayout import BoxLayout
+    from kivyx.uix.scrollview import KXScrollView
+    from kivyx.uix.behaviors.draggable import KXDraggableBehavior, KXDragReorderBehavior
+
+    class Draggable(KXDraggableBehavior, Label):
+        pass
+
+    class ReorderableBox(KXDragReorderBehavior, BoxLayout):
+        pass
+
+    # The inner view covers the whole viewport of the outer one, and both can scroll upwards.
+    outer = KXScrollView(do_scroll_x=False, size_hint=(None, None), size=(200, 200), autoscroll_margin=50)
+    outer_content = BoxLayout(orientation="vertical", size_hint=(1, None), height=2000)
+    outer_content.add_widget(Widget())
+    inner = KXScrollView(do_scroll_x=False, size_hint=(1, None), height=200, autoscroll_margin=50)
+    box = ReorderableBox(orientation="vertical", drag_classes=["test", ], size_hint=(1, None), height=2000)
+    for i in range(20):
+        box.add_widget(Draggable(text=str(i), drag_cls="test", drag_timeout=0))
+    inner.add_widget(box)
+    outer_content.add_widget(inner)
+    outer.add_widget(outer_content)
+    # An unrelated view under the pointer.
+    unrelated = KXScrollView(do_scroll_x=False, size_hint=(None, None), size=(200, 200), autoscroll_margin=50)
+    unrelated.add_widget(Widget(size_hint=(1, None), height=2000))
+    Window.add_widget(unrelated)
+    Window.add_widget(outer)
+    try:
+        tick(kivy_clock, 3)
+        assert outer.content_y == inner.content_y == unrelated.content_y == 0
+        touch = UnitTestTouch(100, 50)
+        touch.touch_down()
+        tick(kivy_clock)
+        touch.touch_move(100, 80)
+        touch.touch_move(100, 190)
+        tick(kivy_clock, 10)
+        assert inner.content_y < 0
+        assert outer.content_y == 0
+        assert unrelated.content_y == 0
+        touch.touch_move(100, 100)
+        touch.touch_up()
+        tick(kivy_clock, 20)
+    finally:
+        Window.remove_widget(outer)
+        Window.remove_widget(unrelated)
+
+
+def test_recycle_reorder(kivy_clock):
+    from kivy.core.window import Window
+    from kivy.tests.common import UnitTestTouch
+    from kivy.uix.label import Label
+    from kivy.uix.recycleview import RecycleView
+    from kivy.uix.recycleboxlayout import RecycleBoxLayout
+    from kivyx.uix.behaviors.draggable import KXDraggableBehavior, KXRecycleDragReorderBehavior
+
+    class Item(KXDraggableBehavior, Label):
+        pass
+
+    class ReorderableRecycleBoxLayout(KXRecycleDragReorderBehavior, RecycleBoxLayout):
+        pass
+
+    rv = RecycleView(size_hint=(None, None), size=(200, 200), scroll_timeout=0)
+    layout = ReorderableRecycleBoxLayout(
+        orientation="vertical", size_hint_y=None, default_size=(None, 20), default_size_hint=(1, None),
+        drag_classes=["test", ])
+    layout.bind(minimum_height=layout.setter("height"))
+    rv.add_widget(layout)
+    rv.viewclass = Item
+    rv.data = [
+        {"text": str(i), "drag_cls": "test", "drag_timeout": 0, "drag_mode": "transform"}
+        for i in range(10000)
+    ]
+    Window.add_widget(rv)
+    try:
+        tick(kivy_clock, 5)
+        top = max(layout.children, key=lambda w: w.y)
+        assert top.text == "0"
+        x, y = top.to_window(*top.center)
+        touch = UnitTestTouch(x, y)
+        touch.touch_down()
+        tick(kivy_clock, 5)  # RecycleView delays the touch for a few frames
+        assert top.is_being_dragged
+        for i in range(1, 11):
+            touch.touch_move(x, y - 7 * i)
+            tick(kivy_clock, 1)
+        touch.touch_up()
+        tick(kivy_clock, 20)
+        assert [d["text"] for d in rv.data[:5]] == ["1", "2", "3", "0", "4"]
+        assert len(rv.data) == 10000
+        assert not layout.canvas.after.children
+    finally:
+        Window.remove_widget(rv)
+
+
+def test_enter_and_leave(kivy_clock, board):
+    from kivy.core.window import Window
+    from kivy.tests.common import UnitTestTouch
+    from kivy.uix.widget import Widget
+    from kivyx.uix.behaviors.draggable import KXDragTargetBehavior, _hover_resolver
+
+    class Target(KXDragTargetBehavior, Widget):
+        pass
+
+    left, right = board
+    right.drag_classes = []
+    target = Target(drag_classes=["test", ], size_hint=(None, None), size=(100, 100), pos=(Window.width - 100, 0))
+    Window.add_widget(target)
+    try:
+        events = []
+        target.bind(on_drag_enter=lambda *__: events.append("enter"), on_drag_leave=lambda *__: events.append("leave"))
+        tick(kivy_clock)
+        d = left.children[0]
+        touch = UnitTestTouch(*d.to_window(*d.center))
+        touch.touch_down()
+        tick(kivy_clock)
+        for pos in ((target.center_x, target.center_y), (target.x - 50, target.center_y),
+                    (target.center_x, target.center_y), (target.center_x + 10, target.center_y)):
+            touch.touch_move(*pos)
+            tick(kivy_clock, 1)
+        assert events == ["enter", "leave", "enter"]
+        touch.touch_up()
+        tick(kivy_clock, 20)
+        assert events == ["enter", "leave", "enter", "leave"]
+        assert d.parent is target
+        assert not _hover_resolver._watchers
+    finally:
+        Window.remove_widget(target)
+
+
+def test_widget_state():
+    from kivy.uix.widget import Widget
+    from kivyx.uix.behaviors.draggable import save_widget_state, restore_widget_state
+    parent = Widget()
+    children = [Widget() for __ in range(3)]
+    for c in children:
+        parent.add_widget(c)
+    w = children[1]
+    w.pos_hint = {"x": .5}
+    state = save_widget_state(w)
+    parent.remove_widget(w)
+    w.pos_hint["x"] = .2
+    w.size_hint_x = None
+    w.width = 10
+    restore_widget_state(w, state)
+    assert parent.children == children[::-1]
+    assert w.pos_hint == {"x": .5}
+    assert w.size_hint_x == 1
+    assert w.width == 100
@@ -0,0 +1,222 @@
+import pytest
+
+
+def tick(kivy_clock, n):
+    for __ in range(n):
+        kivy_clock.tick()
+
+
+def test_recycle_swipe2delete(kivy_clock):
+    from kivy.core.window import Window
+    from kivy.tests.common import UnitTestTouch
+    from kivy.uix.label import Label
+    from kivy.uix.recycleview import RecycleView
+    from kivy.uix.recycleboxlayout import RecycleBoxLayout
+    from kivyx.uix.behaviors.swipe2delete import KXRecycleSwipe2DeleteBehavior
+    from kivyx.uix.behaviors._reorderanimator import _reorder_animator
+
+    class SwipeableRecycleBoxLayout(KXRecycleSwipe2DeleteBehavior, RecycleBoxLayout):
+        pass
+
+    rv = RecycleView(size_hint=(None, None), size=(200, 200), scroll_timeout=0, do_scroll_x=False)
+    layout = SwipeableRecycleBoxLayout(
+        orientation="vertical", size_hint_y=None, default_size=(None, 20), default_size_hint=(1, None),
+        s2d_swipe_threshold=10, s2d_delete_threshold=50)
+    layout.bind(minimum_height=layout.setter("height"))
+    rv.add_widget(layout)
+    rv.viewclass = Label
+    rv.data = [{"text": str(i)} for i in range(1000)]
+    deletions = []
+    layout.bind(on_data_delete=lambda __, indices: deletions.append(indices))
+    Window.add_widget(rv)
+    try:
+        tick(kivy_clock, 5)
+        assert layout.get_index_at(10, layout.top - 1) == 0
+        assert layout.get_index_at(10, layout.top - 21) == 1
+        views = sorted(layout.children, key=lambda w: -w.y)
+        touches = [UnitTestTouch(*views[i].to_window(*views[i].center)) for i in (1, 3)]
+        for t in touches:
+            t.touch_down()
+        tick(kivy_clock, 5)  # RecycleView delays the touch for a few frames
+        for i in range(1, 11):
+            for t in touches:
+                t.touch_move(t.ox + 10 * i, t.oy)
+            tick(kivy_clock, 1)
+        for t in touches:
+            t.touch_up()
+        tick(kivy_clock, 1)
+        assert deletions == [[1, 3]]
+        assert [d["text"] for d in rv.data[:4]] == ["0", "2", "4", "5"]
+        assert len(rv.data) == 998
+        tick(kivy_clock, 1)
+        assert _reorder_animator.is_active  # the views below the deleted ones slide up
+    finally:
+        Window.remove_widget(rv)
+
+
+@pytest.mark.parametrize('orientation', ('vertical', 'horizontal'))
+def test_find_child_at(orientation):
+    from kivy.uix.boxlayout import BoxLayout
+    from kivy.uix.widget import Widget
+    from kivyx.uix.behaviors.swipe2delete import _find_child_at
+
+    layout = BoxLayout(orientation=orientation, spacing=10, padding=10, size=(430, 430))
+    for __ in range(4):
+        layout.add_widget(Widget())
+    layout.do_layout()
+    for c in layout.children:
+        assert _find_child_at(layout, *c.center) is c
+        assert _find_child_at(layout, c.x, c.y) is c
+    assert _find_child_at(layout, 5, 5) is None  # padding
+    first = layout.children[-1]
+    gap = (first.right + 5, first.center_y) if orientation == 'horizontal' else (first.center_x, first.y - 5)
+    assert _find_child_at(layout, *gap) is None  # spacing
+
+
+def test_swipe_is_applied_once_per_frame(kivy_clock):
+    from kivy.core.window import Window
+    from kivy.graphics import Translate
+    from kivy.tests.common import UnitTestTouch
+    from kivy.uix.boxlayout import BoxLayout
+    from kivy.uix.widget import Widget
+    from kivyx.uix.behaviors.swipe2delete import KXSwipe2DeleteBehavior
+
+    class SwipeableBoxLayout(KXSwipe2DeleteBehavior, BoxLayout):
+        pass
+
+    layout = SwipeableBoxLayout(orientation="vertical", s2d_swipe_threshold=10, s2d_delete_threshold=100)
+    for __ in range(3):
+        layout.add_widget(Widget())
+    Window.add_widget(layout)
+    try:
+        tick(kivy_clock, 3)
+        c = layout.children[1]
+        t = UnitTestTouch(*c.to_window(*c.center))
+        t.touch_down()
+        t.touch_move(t.ox + 20, t.oy)  # exceeds the swipe threshold
+        translate = c.canvas.before.children[1].children[0]
+        assert isinstance(translate, Translate)
+        for i in range(3, 6):
+            t.touch_move(t.ox + 10 * i, t.oy)
+            assert translate.x == 0.
+        tick(kivy_clock, 1)
+        assert translate.x == pytest.approx(50.)
+        assert c.canvas.opacity < 1.
+        assert c.opacity == 1.
+        t.touch_up()
+        tick(kivy_clock, 1)
+        assert c.canvas.opacity == 1.
+        assert c.parent is layout
+    finally:
+        Window.remove_widget(layout)
+
+
+def test_swipe_actions(kivy_clock):
+    from kivy.core.window import Window
+    from kivy.tests.common import UnitTestTouch
+    from kivy.uix.boxlayout import BoxLayout
+    from kivy.uix.widget import Widget
+    from kivyx.uix.behaviors.swipe2delete import KXSwipeActionsBehavior
+
+    class SwipeableBoxLayout(KXSwipeActionsBehavior, BoxLayout):
+        pass
+
+    created = []
+
+    def factory():
+        created.append(panel := Widget())
+        return panel
+
+    opened = []
+    layout = SwipeableBoxLayout(
+        orientation="vertical", s2d_swipe_threshold=10, s2d_delete_threshold=300, s2d_actions_size=100,
+        s2d_actions_factory=factory, on_s2d_actions_open=lambda l, c, p: opened.append((c, p)))
+    for __ in range(3):
+        layout.add_widget(Widget())
+    Window.add_widget(layout)
+
+    def swipe(c, distance):
+        t = UnitTestTouch(*c.to_window(*c.center))
+        t.touch_down()
+        for i in range(1, 11):
+            t.touch_move(t.ox - distance * i / 10, t.oy)
+            kivy_clock.tick()
+        t.touch_up()
+        kivy_clock.tick()
+
+    try:
+        kivy_clock.tick()
+        kivy_clock.tick()
+        assert not created  # panels are created lazily
+
+        # a short swipe closes the actions on release
+        c = layout.children[1]
+        swipe(c, 50)
+        assert opened == [(c, created[0])]
+        assert created[0].parent is None
+
+        # a long enough swipe keeps them open
+        swipe(c, 200)
+        assert len(created) == 1  # the panel is reused
+        panel = created[0]
+        assert panel.parent is Window
+        assert panel.width == 100
+        assert panel.right == c.right
+        layout.s2d_close_actions()
+        kivy_clock.tick()
+        assert panel.parent is None
+
+        swipe(c, 200)
+        assert panel.parent is Window
+        t = UnitTestTouch(5, 5)  # outside the panel
+        t.touch_down()
+        t.touch_up()
+        kivy_clock.tick()
+        assert panel.parent is None
+        assert len(created) == 1
+        assert c.parent is layout
+
+        swipe(c, 400)
+        assert c.parent is None
+    finally:
+        Window.remove_widget(layout)
+
+
+def test_swipe_inside_relative_layout(kivy_clock):
+    from kivy.core.window import Window
+    from kivy.graphics import Translate
+    from kivy.tests.common import UnitTestTouch
+    from kivy.uix.boxlayout import BoxLayout
+    from kivy.uix.relativelayout import RelativeLayout
+    from kivy.uix.widget import Widget
+    from kivyx.uix.behaviors.swipe2delete import KXSwipe2DeleteBehavior
+
+    class SwipeableBoxLayout(KXSwipe2DeleteBehavior, BoxLayout):
+        pass
+
+    root = RelativeLayout(size_hint=(None, None), pos=(300, 100), size=(200, 200))
+    layout = SwipeableBoxLayout(orientation="vertical", s2d_swipe_threshold=10, s2d_delete_threshold=150)
+    for __ in range(4):
+        layout.add_widget(Widget())
+    root.add_widget(layout)
+    Window.add_widget(root)
+    try:
+        tick(kivy_clock, 3)
+        c = layout.children[1]
+        t = UnitTestTouch(*c.to_window(*c.center))
+        t.touch_down()
+        tick(kivy_clock, 1)
+        t.touch_move(t.x + 2, t.y)
+        tick(kivy_clock, 1)
+        assert not t.ud["kivyx_exclusive_access"].is_fired  # 2px is below the threshold
+        t.touch_move(t.x + 18, t.y)
+        tick(kivy_clock, 1)
+        assert t.ud["kivyx_exclusive_access"].is_fired
+        t.touch_move(t.x + 20, t.y)
+        tick(kivy_clock, 1)
+        translate, = [i for i in c.canvas.before.children[1].children if isinstance(i, Translate)]
+        assert translate.x == pytest.approx(40)
+        t.touch_up()
+        tick(kivy_clock, 1)
+    finally:
+        Window.remove_widget(root)
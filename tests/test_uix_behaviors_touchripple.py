@@ -0,0 +1,69 @@
+import pytest
+
+
+@pytest.fixture()
+def ripple_widget(kivy_clock):
+    from kivy.core.window import Window
+    from kivy.uix.widget import Widget
+    from kivyx.uix.behaviors.touchripple import KXTouchRippleBehavior
+
+    class RippleWidget(KXTouchRippleBehavior, Widget):
+        pass
+
+    w = RippleWidget(size_hint=(None, None), size=(100, 100), ripple_fadeout_duration=0)
+    Window.add_widget(w)
+    kivy_clock.tick()
+    yield w
+    Window.remove_widget(w)
+
+
+def test_ripples_are_pooled(kivy_clock, ripple_widget):
+    from kivy.tests.common import UnitTestTouch
+    from kivyx.uix.behaviors.touchripple import _ripple_driver
+    w = ripple_widget
+    n_instructions = len(w.canvas.children)
+    for __ in range(2):
+        touch = UnitTestTouch(50, 50)
+        touch.touch_down()
+        kivy_clock.tick()
+        assert _ripple_driver.has_ripples_of(w)
+        assert len(w.canvas.children) == n_instructions + 1
+        touch.touch_up()
+        kivy_clock.tick()
+        assert not _ripple_driver.has_ripples_of(w)
+        assert len(w.canvas.children) == n_instructions
+        assert _ripple_driver._clock_event is None
+    assert len(_ripple_driver._pool) == 1
+
+
+def test_max_ripples(kivy_clock, ripple_widget, monkeypatch):
+    from kivy.tests.common import UnitTestTouch
+    from kivyx.uix.behaviors.touchripple import KXTouchRippleBehavior, _ripple_driver
+    monkeypatch.setattr(KXTouchRippleBehavior, "max_concurrent_ripples", 2)
+    touches = [UnitTestTouch(50, 50) for __ in range(3)]
+    for t in touches:
+        t.touch_down()
+    assert len(_ripple_driver._ripples) == 2
+    for t in touches:
+        t.touch_up()
+    kivy_clock.tick()
+    assert not _ripple_driver._ripples
+
+
+def test_shader_renderer(kivy_clock, ripple_widget):
+    from kivy.graphics import RenderContext
+    from kivy.tests.common import UnitTestTouch
+    w = ripple_widget
+    w.ripple_renderer = "shader"
+    kivy_clock.tick()
+    n_instructions = len(w.canvas.children)
+    touches = [UnitTestTouch(50, 50) for __ in range(3)]
+    for t in touches:
+        t.touch_down()
+    kivy_clock.tick()
+    assert len(w.canvas.children) == n_instructions + 1
+    assert isinstance(w.canvas.children[-1], RenderContext)
+    for t in touches:
+        t.touch_up()
+    kivy_clock.tick()
+    assert len(w.canvas.children) == n_instructions
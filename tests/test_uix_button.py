@@ -0,0 +1,21 @@
+import pytest
+
+
+@pytest.mark.parametrize('stencil_free', (False, True))
+def test_stencil_free(kivy_clock, stencil_free):
+    from kivy.graphics import StencilPush
+    from kivyx.uix.button import KXButton
+    b = KXButton(stencil_free=stencil_free)
+    background = b.canvas.before.children[0]
+    has_stencil = any(isinstance(inst, StencilPush) for inst in background.children)
+    assert has_stencil is not stencil_free
+    assert b.ripple_renderer == ("shader" if stencil_free else "instructions")
+
+
+def test_stencil_free_restores_ripple_settings(kivy_clock):
+    from kivyx.uix.button import KXButton
+    b = KXButton(ripple_clip_radius=4)
+    b.stencil_free = True
+    assert (b.ripple_renderer, b.ripple_clip_radius) == ("shader", 10)
+    b.stencil_free = False
+    assert (b.ripple_renderer, b.ripple_clip_radius) == ("instructions", 4)
@@ -91,3 +91,25 @@ def test_scroll_to_scrollview_itself(kivy_clock):
     kivy_clock.tick()
     with pytest.raises(ValueError):
         sv.scroll_to_widget(sv)
+
+
+def test_graphics_follow_properties(kivy_clock):
+    from kivy.graphics import Translate, Rectangle
+    sv = KXScrollView(pos=(10, 20), size=(100, 200), hbar_color=(1, 0, 0, 1))
+    before = sv.canvas.before.children[0].children
+    after = sv.canvas.after.children[0].children
+    translate, content_translate = [i for i in before if isinstance(i, Translate)]
+    content_untranslate = after[0]
+    mask = next(i for i in before if isinstance(i, Rectangle))
+    hbar = next(i for i in after if isinstance(i, Rectangle))
+    assert translate.xy == (10, 20)
+    assert mask.size == (100, 200)
+    assert after[1].rgba == [1, 0, 0, 1]
+    sv.content_x = 30
+    sv.content_y = -40
+    assert sv._content_x == 30
+    assert sv._content_y == -40
+    assert content_translate.xy == (30, -40)
+    assert content_untranslate.xy == (-30, 40)
+    sv.hbar_x = 5
+    assert hbar.pos == (5, sv.hbar_y)
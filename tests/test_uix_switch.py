@@ -0,0 +1,25 @@
+import pytest
+
+
+def test_smoothing(touch_driver):
+    from kivyx.uix.switch import KXSwitch, count_active_transitions
+
+    def wait_for_transitions_to_end():
+        for __ in range(180):  # 3 seconds of the virtual time
+            if not count_active_transitions():
+                return
+            touch_driver.frame()
+        assert not count_active_transitions()
+
+    switches = [KXSwitch() for __ in range(3)]
+    touch_driver.frame()
+    assert count_active_transitions() == 0  # The initial state is not animated.
+    for s in switches:
+        s.active = True
+    touch_driver.frame()
+    assert count_active_transitions() == 6  # the thumb color does not change
+    wait_for_transitions_to_end()
+    for s in switches:
+        track_transition, __, thumb_transition = s._transitions
+        assert tuple(thumb_transition.follower.pos) == s._thumb_pos
+        assert tuple(track_transition.follower.rgba) == pytest.approx(s.track_active_color)